@@ -2,6 +2,7 @@ import streamlit as st
 import json
 import pandas as pd
 from utils.resume_analyzer import ResumeAnalyzer
+from utils.analysis_cache import get_analysis_cache
 from utils.resume_builder import ResumeBuilder
 from config.database import get_database_connection, save_resume_data, save_analysis_data, init_database
 from config.job_roles import JOB_ROLES
@@ -34,6 +35,7 @@ class ResumeApp:
 
         self.dashboard_manager = DashboardManager()
         self.analyzer = ResumeAnalyzer()
+        self.analysis_cache = get_analysis_cache()
         self.builder = ResumeBuilder()
         self.job_roles = JOB_ROLES
 
@@ -59,11 +61,29 @@ class ResumeApp:
         uploaded_file = st.file_uploader("Upload your resume", type=['pdf', 'docx'])
         if uploaded_file:
             with st.spinner("Analyzing..."):
-                text = self.analyzer.extract_text(uploaded_file)
-                analysis = self.analyzer.analyze_resume(text)
+                # Reruns and re-uploads of the same file skip extraction and analysis
+                role = st.session_state.selected_role
+                analysis = self.analysis_cache.get_or_compute(
+                    uploaded_file.getvalue(), role,
+                    lambda: self.analyze_uploaded_file(uploaded_file, role)
+                )
                 st.write("Analysis Results:")
                 st.json(analysis)
 
+    def analyze_uploaded_file(self, uploaded_file, role=None):
+        """Extract text from an uploaded resume and analyze it for the given role"""
+        if uploaded_file.name.lower().endswith('.pdf'):
+            text = self.analyzer.extract_text_from_pdf(uploaded_file)
+        else:
+            text = self.analyzer.extract_text_from_docx(uploaded_file)
+
+        job_requirements = {}
+        for roles in self.job_roles.values():
+            if role in roles:
+                job_requirements = roles[role]
+                break
+        return self.analyzer.analyze_resume({'raw_text': text}, job_requirements)
+
     def render_builder(self):
         """Render the resume builder page"""
         st.title("Resume Builder 📝")
@@ -168,14 +168,10 @@ INTERVIEW_VIDEOS = {
 
 def get_courses_for_role(role_name):
     """Helper function to get courses for a specific role"""
-    for category, roles in COURSES_BY_CATEGORY.items():
-        if role_name in roles:
-            return roles[role_name]
-    return None
+    from config.role_index import ROLE_TO_COURSES
+    return ROLE_TO_COURSES.get(role_name)
 
 def get_category_for_role(role_name):
     """Helper function to get the category for a specific role"""
-    for category, roles in COURSES_BY_CATEGORY.items():
-        if role_name in roles:
-            return category
-    return None
\ No newline at end of file
+    from config.role_index import ROLE_TO_CATEGORY
+    return ROLE_TO_CATEGORY.get(role_name)
@@ -1,11 +1,43 @@
+import ast
 import sqlite3
+import threading
 from datetime import datetime
+from config.query_cache import cached_query, query_cache
+
+DB_PATH = 'resume_data.db'
+
+# Seconds a connection waits for a competing writer before giving up
+BUSY_TIMEOUT = 10.0
+
+# Each thread (one per Streamlit script run) reuses a single connection
+_local = threading.local()
+
+def _configure_connection(conn):
+    """Apply WAL journaling and tuned pragmas to a new connection"""
+    # WAL lets readers proceed while a writer commits; NORMAL sync is durable in WAL mode
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA cache_size=-16000')  # 16 MB page cache
+    conn.execute('PRAGMA mmap_size=268435456')  # 256 MB memory-mapped reads
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute(f'PRAGMA busy_timeout={int(BUSY_TIMEOUT * 1000)}')
 
 def get_database_connection():
-    """Create and return a database connection"""
-    conn = sqlite3.connect('resume_data.db')
+    """Return this thread's database connection, opening it on first use"""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, timeout=BUSY_TIMEOUT)
+        _configure_connection(conn)
+        _local.conn = conn
     return conn
 
+def close_database_connection():
+    """Close this thread's cached connection, if any"""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
 def init_database():
     """Initialize database tables"""
     conn = get_database_connection()
@@ -83,7 +115,297 @@ def init_database():
     ''')
     
     conn.commit()
-    conn.close()
+    run_migrations(conn)
+
+# Schema migrations applied in order on top of the tables above. Each entry is
+# (version, description, steps) where a step is an SQL statement or a callable
+# taking the connection. PRAGMA user_version records the last applied version.
+# Only append new entries; never edit one that has shipped.
+MIGRATIONS = [
+    (1, 'Index resume lookups and the analysis join', [
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_created_at ON resume_data (created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_target_role ON resume_data (target_role)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_target_category ON resume_data (target_category)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_analysis_resume_id ON resume_analysis (resume_id)'
+    ]),
+    (2, 'Index and backfill normalized skill rows', [
+        'CREATE INDEX IF NOT EXISTS idx_resume_skills_resume_id ON resume_skills (resume_id)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_skills_skill_name ON resume_skills (skill_name COLLATE NOCASE)',
+        # Resumes saved before skills were normalized, so the skill rollups below start complete
+        lambda conn: _backfill_resume_skills(conn)
+    ]),
+    (3, 'Maintain per-day resume and score rollups', [
+        '''
+        CREATE TABLE IF NOT EXISTS daily_stats (
+            day TEXT PRIMARY KEY,
+            resumes INTEGER NOT NULL DEFAULT 0,
+            ats_sum REAL NOT NULL DEFAULT 0,
+            ats_count INTEGER NOT NULL DEFAULT 0,
+            keyword_sum REAL NOT NULL DEFAULT 0,
+            keyword_count INTEGER NOT NULL DEFAULT 0,
+            high_scoring INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+        # Analyses are bucketed by the day of their resume, matching the
+        # dashboard's join on resume_data.created_at
+        '''
+        INSERT INTO daily_stats (day, resumes, ats_sum, ats_count, keyword_sum, keyword_count, high_scoring)
+        SELECT
+            DATE(rd.created_at),
+            COUNT(DISTINCT rd.id),
+            COALESCE(SUM(ra.ats_score), 0),
+            COUNT(ra.ats_score),
+            COALESCE(SUM(ra.keyword_match_score), 0),
+            COUNT(ra.keyword_match_score),
+            COUNT(DISTINCT CASE WHEN ra.ats_score >= 70 THEN rd.id END)
+        FROM resume_data rd
+        LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+        GROUP BY DATE(rd.created_at)
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_daily_stats_resume
+        AFTER INSERT ON resume_data
+        BEGIN
+            INSERT OR IGNORE INTO daily_stats (day) VALUES (DATE(NEW.created_at));
+            UPDATE daily_stats SET resumes = resumes + 1 WHERE day = DATE(NEW.created_at);
+        END
+        ''',
+        # A resume counts as high scoring once, however many of its analyses reach 70
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_daily_stats_analysis
+        AFTER INSERT ON resume_analysis
+        WHEN EXISTS (SELECT 1 FROM resume_data WHERE id = NEW.resume_id)
+        BEGIN
+            UPDATE daily_stats SET
+                ats_sum = ats_sum + COALESCE(NEW.ats_score, 0),
+                ats_count = ats_count + (NEW.ats_score IS NOT NULL),
+                keyword_sum = keyword_sum + COALESCE(NEW.keyword_match_score, 0),
+                keyword_count = keyword_count + (NEW.keyword_match_score IS NOT NULL),
+                high_scoring = high_scoring + (
+                    CASE WHEN NEW.ats_score >= 70 AND NOT EXISTS (
+                        SELECT 1 FROM resume_analysis
+                        WHERE resume_id = NEW.resume_id AND id <> NEW.id AND ats_score >= 70
+                    ) THEN 1 ELSE 0 END
+                )
+            WHERE day = (SELECT DATE(created_at) FROM resume_data WHERE id = NEW.resume_id);
+        END
+        '''
+    ]),
+    (4, 'Materialize skill frequencies', [
+        # All-time totals for the unfiltered Top Skills chart
+        '''
+        CREATE TABLE IF NOT EXISTS skill_totals (
+            skill_key TEXT PRIMARY KEY,
+            skill_name TEXT NOT NULL,
+            resumes INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_skill_totals_resumes ON skill_totals (resumes DESC)',
+        # Per role and day counts for filtered views
+        '''
+        CREATE TABLE IF NOT EXISTS skill_stats (
+            skill_key TEXT NOT NULL,
+            target_role TEXT NOT NULL,
+            day TEXT NOT NULL,
+            skill_name TEXT NOT NULL,
+            resumes INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (skill_key, target_role, day)
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_skill_stats_role_day ON skill_stats (target_role, day)',
+        'CREATE INDEX IF NOT EXISTS idx_skill_stats_day ON skill_stats (day)',
+        '''
+        INSERT INTO skill_totals (skill_key, skill_name, resumes)
+        SELECT LOWER(skill_name), MIN(skill_name), COUNT(*)
+        FROM resume_skills
+        GROUP BY LOWER(skill_name)
+        ''',
+        '''
+        INSERT INTO skill_stats (skill_key, target_role, day, skill_name, resumes)
+        SELECT LOWER(s.skill_name), COALESCE(r.target_role, ''), DATE(r.created_at), MIN(s.skill_name), COUNT(*)
+        FROM resume_skills s
+        JOIN resume_data r ON r.id = s.resume_id
+        GROUP BY LOWER(s.skill_name), COALESCE(r.target_role, ''), DATE(r.created_at)
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_skill_stats
+        AFTER INSERT ON resume_skills
+        BEGIN
+            INSERT OR IGNORE INTO skill_totals (skill_key, skill_name)
+            VALUES (LOWER(NEW.skill_name), NEW.skill_name);
+            UPDATE skill_totals SET resumes = resumes + 1 WHERE skill_key = LOWER(NEW.skill_name);
+
+            INSERT OR IGNORE INTO skill_stats (skill_key, target_role, day, skill_name)
+            SELECT LOWER(NEW.skill_name), COALESCE(target_role, ''), DATE(created_at), NEW.skill_name
+            FROM resume_data WHERE id = NEW.resume_id;
+            UPDATE skill_stats SET resumes = resumes + 1
+            WHERE skill_key = LOWER(NEW.skill_name)
+              AND (target_role, day) = (
+                  SELECT COALESCE(target_role, ''), DATE(created_at)
+                  FROM resume_data WHERE id = NEW.resume_id
+              );
+        END
+        '''
+    ])
+]
+
+def get_schema_version(conn):
+    """Return the last migration version applied to the database"""
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+def run_migrations(conn=None):
+    """Apply pending schema migrations and return the resulting schema version"""
+    conn = conn or get_database_connection()
+    version = get_schema_version(conn)
+    
+    for target_version, description, steps in MIGRATIONS:
+        if target_version <= version:
+            continue
+        try:
+            # Take the write lock first so concurrent sessions apply each migration once
+            conn.execute('BEGIN IMMEDIATE')
+            version = get_schema_version(conn)
+            if target_version > version:
+                for step in steps:
+                    if callable(step):
+                        step(conn)
+                    else:
+                        conn.execute(step)
+                conn.execute(f'PRAGMA user_version = {target_version}')
+                version = target_version
+            conn.commit()
+        except Exception as e:
+            print(f"Error applying migration {target_version} ({description}): {str(e)}")
+            conn.rollback()
+            raise
+    
+    return version
+
+def _parse_stored_list(value):
+    """Parse a str(list) or str(dict) blob written to resume_data by save_resume_data"""
+    value = value.strip()
+    if not value:
+        return []
+    try:
+        parsed = ast.literal_eval(value)
+        if isinstance(parsed, (list, tuple, set, dict)):
+            return parsed
+    except (ValueError, SyntaxError):
+        pass
+    return [item.strip(" '\"") for item in value.strip('[]').split(',')]
+
+def normalize_skills(skills):
+    """Return de-duplicated (skill_name, skill_category) pairs for resume_skills.
+
+    Accepts a list of skills, a dict of category -> skills (as built by the
+    resume builder) or a str(list) blob from the resume_data.skills column.
+    """
+    if isinstance(skills, str):
+        skills = _parse_stored_list(skills)
+    if isinstance(skills, dict):
+        items = [(skill, category) for category, names in skills.items()
+                 for skill in ([names] if isinstance(names, str) else names or [])]
+    else:
+        items = [(skill, 'general') for skill in (skills or [])]
+
+    seen = set()
+    rows = []
+    for skill, category in items:
+        name = ' '.join(str(skill).split())
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            rows.append((name, category or 'general'))
+    return rows
+
+def _backfill_resume_skills(conn):
+    """Insert resume_skills rows for resumes that have none, without committing"""
+    cursor = conn.cursor()
+    cursor.execute('''
+    SELECT id, skills FROM resume_data r
+    WHERE NOT EXISTS (SELECT 1 FROM resume_skills s WHERE s.resume_id = r.id)
+    ''')
+    resumes = 0
+    rows = []
+    for resume_id, skills in cursor.fetchall():
+        resumes += 1
+        rows.extend((resume_id, name, category) for name, category in normalize_skills(skills or ''))
+
+    cursor.executemany('''
+    INSERT INTO resume_skills (resume_id, skill_name, skill_category)
+    VALUES (?, ?, ?)
+    ''', rows)
+    return resumes, len(rows)
+
+def backfill_resume_skills():
+    """Populate resume_skills for resumes saved before skills were normalized"""
+    conn = get_database_connection()
+
+    try:
+        resumes, skills = _backfill_resume_skills(conn)
+        conn.commit()
+        query_cache.invalidate()
+        return resumes, skills
+    except Exception as e:
+        print(f"Error backfilling resume skills: {str(e)}")
+        conn.rollback()
+        return 0, 0
+
+RESUME_INSERT_SQL = '''
+INSERT INTO resume_data (
+    name, email, phone, linkedin, github, portfolio,
+    summary, target_role, target_category, education, 
+    experience, projects, skills, template
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+ANALYSIS_INSERT_SQL = '''
+INSERT INTO resume_analysis (
+    resume_id, ats_score, keyword_match_score,
+    format_score, section_score, missing_skills,
+    recommendations
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+SKILL_INSERT_SQL = '''
+INSERT INTO resume_skills (resume_id, skill_name, skill_category)
+VALUES (?, ?, ?)
+'''
+
+def _resume_row(data):
+    """Build the resume_data parameters for a resume dict"""
+    personal_info = data.get('personal_info', {})
+    return (
+        personal_info.get('full_name', ''),
+        personal_info.get('email', ''),
+        personal_info.get('phone', ''),
+        personal_info.get('linkedin', ''),
+        personal_info.get('github', ''),
+        personal_info.get('portfolio', ''),
+        data.get('summary', ''),
+        data.get('target_role', ''),
+        data.get('target_category', ''),
+        str(data.get('education', [])),
+        str(data.get('experience', [])),
+        str(data.get('projects', [])),
+        str(data.get('skills', [])),
+        data.get('template', '')
+    )
+
+def _analysis_row(resume_id, analysis):
+    """Build the resume_analysis parameters for an analysis dict"""
+    return (
+        resume_id,
+        float(analysis.get('ats_score', 0)),
+        float(analysis.get('keyword_match_score', 0)),
+        float(analysis.get('format_score', 0)),
+        float(analysis.get('section_score', 0)),
+        analysis.get('missing_skills', ''),
+        analysis.get('recommendations', '')
+    )
+
+def _skill_rows(resume_id, data):
+    """Build the resume_skills parameters for a resume dict"""
+    return [(resume_id, name, category) for name, category in normalize_skills(data.get('skills', []))]
 
 def save_resume_data(data):
     """Save resume data to database"""
@@ -91,39 +413,17 @@ def save_resume_data(data):
     cursor = conn.cursor()
     
     try:
-        personal_info = data.get('personal_info', {})
-        
-        cursor.execute('''
-        INSERT INTO resume_data (
-            name, email, phone, linkedin, github, portfolio,
-            summary, target_role, target_category, education, 
-            experience, projects, skills, template
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            personal_info.get('full_name', ''),
-            personal_info.get('email', ''),
-            personal_info.get('phone', ''),
-            personal_info.get('linkedin', ''),
-            personal_info.get('github', ''),
-            personal_info.get('portfolio', ''),
-            data.get('summary', ''),
-            data.get('target_role', ''),
-            data.get('target_category', ''),
-            str(data.get('education', [])),
-            str(data.get('experience', [])),
-            str(data.get('projects', [])),
-            str(data.get('skills', [])),
-            data.get('template', '')
-        ))
+        cursor.execute(RESUME_INSERT_SQL, _resume_row(data))
+        resume_id = cursor.lastrowid
+        cursor.executemany(SKILL_INSERT_SQL, _skill_rows(resume_id, data))
         
         conn.commit()
-        return cursor.lastrowid
+        query_cache.invalidate()
+        return resume_id
     except Exception as e:
         print(f"Error saving resume data: {str(e)}")
         conn.rollback()
         return None
-    finally:
-        conn.close()
 
 def save_analysis_data(resume_id, analysis):
     """Save resume analysis data"""
@@ -131,28 +431,54 @@ def save_analysis_data(resume_id, analysis):
     cursor = conn.cursor()
     
     try:
-        cursor.execute('''
-        INSERT INTO resume_analysis (
-            resume_id, ats_score, keyword_match_score,
-            format_score, section_score, missing_skills,
-            recommendations
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            resume_id,
-            float(analysis.get('ats_score', 0)),
-            float(analysis.get('keyword_match_score', 0)),
-            float(analysis.get('format_score', 0)),
-            float(analysis.get('section_score', 0)),
-            analysis.get('missing_skills', ''),
-            analysis.get('recommendations', '')
-        ))
+        cursor.execute(ANALYSIS_INSERT_SQL, _analysis_row(resume_id, analysis))
         
         conn.commit()
+        query_cache.invalidate()
     except Exception as e:
         print(f"Error saving analysis data: {str(e)}")
         conn.rollback()
-    finally:
-        conn.close()
+
+def save_many(records):
+    """Save many resumes with their analyses and skills in a single transaction.
+
+    ``records`` is an iterable of (resume_data, analysis) pairs; analysis may
+    be None. Returns the new resume ids in input order, or an empty list if
+    the batch was rolled back.
+    """
+    records = list(records)
+    if not records:
+        return []
+    
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        # Hold the write lock for the whole batch so the new ids are contiguous
+        conn.execute('BEGIN IMMEDIATE')
+        cursor.executemany(RESUME_INSERT_SQL, [_resume_row(data) for data, _ in records])
+        # AUTOINCREMENT hands out consecutive ids after the previous maximum
+        last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+        resume_ids = list(range(last_id - len(records) + 1, last_id + 1))
+        
+        cursor.executemany(ANALYSIS_INSERT_SQL, [
+            _analysis_row(resume_id, analysis)
+            for resume_id, (_, analysis) in zip(resume_ids, records)
+            if analysis is not None
+        ])
+        cursor.executemany(SKILL_INSERT_SQL, [
+            row
+            for resume_id, (data, _) in zip(resume_ids, records)
+            for row in _skill_rows(resume_id, data)
+        ])
+        
+        conn.commit()
+        query_cache.invalidate()
+        return resume_ids
+    except Exception as e:
+        print(f"Error saving resume batch: {str(e)}")
+        conn.rollback()
+        return []
 
 def get_resume_stats():
     """Get statistics about resumes"""
@@ -185,8 +511,6 @@ def get_resume_stats():
     except Exception as e:
         print(f"Error getting resume stats: {str(e)}")
         return None
-    finally:
-        conn.close()
 
 def log_admin_action(admin_email, action):
     """Log admin login/logout actions"""
@@ -201,8 +525,7 @@ def log_admin_action(admin_email, action):
         conn.commit()
     except Exception as e:
         print(f"Error logging admin action: {str(e)}")
-    finally:
-        conn.close()
+        conn.rollback()
 
 def get_admin_logs():
     """Get all admin login/logout logs"""
@@ -219,9 +542,8 @@ def get_admin_logs():
     except Exception as e:
         print(f"Error getting admin logs: {str(e)}")
         return []
-    finally:
-        conn.close()
 
+@cached_query(ttl=30)
 def get_all_resume_data():
     """Get all resume data for admin dashboard"""
     conn = get_database_connection()
@@ -253,8 +575,76 @@ def get_all_resume_data():
     except Exception as e:
         print(f"Error getting resume data: {str(e)}")
         return []
-    finally:
-        conn.close()
+
+# Column order of the rows returned by get_all_resume_data and its paged variants
+RESUME_EXPORT_COLUMNS = [
+    'id', 'name', 'email', 'phone', 'linkedin', 'github', 'portfolio',
+    'target_role', 'target_category', 'created_at',
+    'ats_score', 'keyword_match_score', 'format_score', 'section_score'
+]
+
+def _query_resume_page(limit, after):
+    cursor = get_database_connection().cursor()
+    where = 'WHERE (created_at, id) < (?, ?)' if after else ''
+    cursor.execute(f'''
+    SELECT
+        r.id,
+        r.name,
+        r.email,
+        r.phone,
+        r.linkedin,
+        r.github,
+        r.portfolio,
+        r.target_role,
+        r.target_category,
+        r.created_at,
+        a.ats_score,
+        a.keyword_match_score,
+        a.format_score,
+        a.section_score
+    FROM (
+        SELECT * FROM resume_data
+        {where}
+        ORDER BY created_at DESC, id DESC
+        LIMIT ?
+    ) r
+    LEFT JOIN resume_analysis a ON r.id = a.resume_id
+    ORDER BY r.created_at DESC, r.id DESC, a.id
+    ''', (*(after or ()), limit))
+    rows = cursor.fetchall()
+
+    resumes = len({row[0] for row in rows})
+    next_cursor = (rows[-1][9], rows[-1][0]) if rows and resumes == limit else None
+    return rows, next_cursor
+
+def get_resume_data_page(limit=500, after=None):
+    """Get one page of resume data, newest first, with its analyses.
+
+    Pages are keyed on (created_at, id) rather than OFFSET, so every page is a
+    range read on the created_at index no matter how deep it is. Pass the
+    returned cursor as ``after`` to fetch the next page; it is None on the
+    last page. ``limit`` counts resumes, and each resume's rows stay together.
+    """
+    try:
+        return _query_resume_page(limit, after)
+    except Exception as e:
+        print(f"Error getting resume data page: {str(e)}")
+        return [], None
+
+def iter_resume_data_pages(page_size=500):
+    """Yield every page of resume data in get_all_resume_data order; errors propagate"""
+    after = None
+    while True:
+        rows, after = _query_resume_page(page_size, after)
+        if rows:
+            yield rows
+        if after is None:
+            break
+
+def iter_resume_data(page_size=500):
+    """Stream resume data rows without loading the whole table"""
+    for rows in iter_resume_data_pages(page_size):
+        yield from rows
 
 def verify_admin(email, password):
     """Verify admin credentials"""
@@ -268,8 +658,6 @@ def verify_admin(email, password):
     except Exception as e:
         print(f"Error verifying admin: {str(e)}")
         return False
-    finally:
-        conn.close()
 
 def add_admin(email, password):
     """Add a new admin"""
@@ -282,6 +670,19 @@ def add_admin(email, password):
         return True
     except Exception as e:
         print(f"Error adding admin: {str(e)}")
+        conn.rollback()
         return False
-    finally:
-        conn.close()
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Resume database maintenance")
+    parser.add_argument('command', choices=['migrate', 'backfill-skills'])
+    args = parser.parse_args()
+    
+    init_database()
+    if args.command == 'backfill-skills':
+        resumes, skills = backfill_resume_skills()
+        print(f"Backfilled {skills} skills for {resumes} resumes")
+    else:
+        print(f"Database schema is at version {get_schema_version(get_database_connection())}")
@@ -0,0 +1,91 @@
+import functools
+import threading
+import time
+
+
+class QueryCache:
+    """Process-wide cache of query results with per-entry TTLs.
+
+    Streamlit reruns the whole script on every widget interaction; caching
+    read-only dashboard and admin queries here keeps those reruns off SQLite.
+    Writers call invalidate() so fresh data is visible immediately, and the
+    TTL bounds staleness from writes made by other processes.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, ttl, compute):
+        """Return the cached value for ``key`` or compute and store it for ``ttl`` seconds"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        value = compute()
+
+        with self._lock:
+            # Skip storing results computed while an invalidation happened
+            if generation == self._generation:
+                if len(self._entries) >= self.max_entries:
+                    self._purge(now)
+                self._entries[key] = (now + ttl, value)
+        return value
+
+    def _purge(self, now):
+        self._entries = {key: entry for key, entry in self._entries.items() if entry[0] > now}
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+
+    def invalidate(self, namespace=None):
+        """Drop cached results, either all of them or those of one namespace"""
+        with self._lock:
+            self._generation += 1
+            if namespace is None:
+                self._entries.clear()
+            else:
+                self._entries = {key: entry for key, entry in self._entries.items() if key[0] != namespace}
+
+    def stats(self):
+        """Return hit, miss and size counters"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+                'entries': len(self._entries)
+            }
+
+
+# Shared by every session in the process
+query_cache = QueryCache()
+
+
+def cached_query(ttl, method=False):
+    """Cache a query function's result in query_cache for ``ttl`` seconds.
+
+    The key is the function name plus its arguments; with ``method=True`` the
+    instance argument is left out so all instances share results.
+    """
+    def decorator(func):
+        namespace = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key_args = args[1:] if method else args
+            key = (namespace, key_args, tuple(sorted(kwargs.items())))
+            return query_cache.get_or_compute(key, ttl, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,96 @@
+"""Lookup indexes over JOB_ROLES and COURSES_BY_CATEGORY, built once at import.
+
+ROLE_TO_CATEGORY, ROLE_TO_COURSES and ROLE_REQUIREMENTS replace walks over
+the nested config dicts with a single dict lookup, and SKILL_TO_ROLES maps a
+normalized skill to every role that asks for it, so matching a resume's
+skills to roles only touches the skills it contains.
+"""
+import re
+
+from config.courses import COURSES_BY_CATEGORY
+from config.job_roles import JOB_ROLES
+
+
+def normalize_key(text):
+    """Lowercase and collapse whitespace so lookups ignore case and spacing"""
+    return re.sub(r'\s+', ' ', str(text)).strip().lower()
+
+
+def split_skill(skill):
+    """Return the normalized keys for a skill; "React/Angular/Vue" also yields each option"""
+    key = normalize_key(skill)
+    parts = [part.strip() for part in key.split('/')]
+    return [key] + [part for part in parts if part and part != key]
+
+
+ROLE_TO_CATEGORY = {}
+ROLE_TO_COURSES = {}
+ROLE_REQUIREMENTS = {}
+ROLE_SKILLS = {}
+SKILL_TO_ROLES = {}
+
+# First match wins, as in the scans these indexes replace
+for category, roles in COURSES_BY_CATEGORY.items():
+    for role, courses in roles.items():
+        ROLE_TO_CATEGORY.setdefault(role, category)
+        ROLE_TO_COURSES.setdefault(role, courses)
+
+for category, roles in JOB_ROLES.items():
+    for role, info in roles.items():
+        ROLE_TO_CATEGORY.setdefault(role, category)
+        ROLE_REQUIREMENTS.setdefault(role, info)
+
+        skills = set()
+        for skill in info.get('required_skills', []) + info.get('recommended_skills', {}).get('technical', []):
+            skills.update(split_skill(skill))
+        ROLE_SKILLS[role] = frozenset(skills)
+        for skill in skills:
+            SKILL_TO_ROLES.setdefault(skill, []).append(role)
+
+SKILL_TO_ROLES = {skill: tuple(roles) for skill, roles in SKILL_TO_ROLES.items()}
+
+# Normalized names back to their canonical spelling
+ROLE_KEYS = {normalize_key(role): role for role in ROLE_TO_CATEGORY}
+CATEGORY_KEYS = {normalize_key(category): category
+                 for category in list(COURSES_BY_CATEGORY) + list(JOB_ROLES)}
+
+
+def resolve_role(name):
+    """Return the canonical role name for any casing or spacing of it, or None"""
+    return ROLE_KEYS.get(normalize_key(name))
+
+
+def resolve_category(name):
+    """Return the canonical category name for any casing or spacing of it, or None"""
+    return CATEGORY_KEYS.get(normalize_key(name))
+
+
+def get_role_requirements(role_name):
+    """Return the JOB_ROLES entry for a role, matched case-insensitively"""
+    return ROLE_REQUIREMENTS.get(resolve_role(role_name))
+
+
+def recommend_roles_for_skills(skills, top_k=5):
+    """Rank roles by how many of the given skills they ask for.
+
+    Each entry has the role, its category, the matched skill keys and the
+    share of the role's indexed skills that matched. Roles with no matching
+    skill are left out.
+    """
+    matches = {}
+    for skill in skills:
+        for key in split_skill(skill):
+            for role in SKILL_TO_ROLES.get(key, ()):
+                matches.setdefault(role, set()).add(key)
+
+    ranked = [
+        {
+            'role': role,
+            'category': ROLE_TO_CATEGORY.get(role),
+            'matched_skills': sorted(matched),
+            'score': round(len(matched) / len(ROLE_SKILLS[role]) * 100, 1)
+        }
+        for role, matched in matches.items()
+    ]
+    ranked.sort(key=lambda entry: (-len(entry['matched_skills']), -entry['score'], entry['role']))
+    return ranked[:top_k] if top_k else ranked
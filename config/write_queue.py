@@ -0,0 +1,142 @@
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from config.database import save_many
+
+_STOP = object()
+
+
+class WriteQueue:
+    """Background writer that group-commits resume saves.
+
+    submit() puts a (resume_data, analysis) pair on a bounded queue and
+    returns a Future for the new resume id. A daemon thread drains the queue,
+    collecting rows for up to ``batch_interval`` seconds (or ``max_batch``
+    rows) and writing each batch with save_many in one transaction; a batch
+    that fails is retried row by row so only the bad rows fail. When the
+    queue stays full for ``put_timeout`` seconds the caller writes its row
+    itself, so a stalled writer slows producers down instead of dropping data.
+    """
+
+    def __init__(self, max_pending=1000, batch_interval=0.05, max_batch=500, put_timeout=5.0):
+        self.batch_interval = batch_interval
+        self.max_batch = max_batch
+        self.put_timeout = put_timeout
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='resume-writer', daemon=True)
+                self._thread.start()
+
+    def submit(self, resume_data, analysis=None):
+        """Queue a resume and its analysis for saving and return a Future for the resume id"""
+        future = Future()
+        self._ensure_started()
+        with self._lock:
+            self.submitted += 1
+        try:
+            self._queue.put((resume_data, analysis, future), timeout=self.put_timeout)
+        except queue.Full:
+            # Back-pressure: the writer is behind, so pay for this write synchronously
+            self._write([(resume_data, analysis, future)])
+        return future
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch, markers, stop = [], [], False
+            deadline = time.monotonic() + self.batch_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if stop or markers or len(batch) >= self.max_batch:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _write(self, batch):
+        resume_ids = save_many([(data, analysis) for data, analysis, _ in batch])
+        if not resume_ids and len(batch) > 1:
+            # One bad row rolls back the whole batch; retry row by row so only it fails
+            resume_ids = [(save_many([(data, analysis)]) or [None])[0] for data, analysis, _ in batch]
+        resume_ids = resume_ids or [None]
+        with self._lock:
+            self.batches += 1
+            failed = sum(1 for resume_id in resume_ids if resume_id is None)
+            self.written += len(batch) - failed
+            self.failed += failed
+        for (_, _, future), resume_id in zip(batch, resume_ids):
+            # A caller may have cancelled its future; that must not kill the writer
+            if not future.set_running_or_notify_cancel():
+                continue
+            if resume_id is None:
+                future.set_exception(RuntimeError("Failed to save resume"))
+            else:
+                future.set_result(resume_id)
+
+    def flush(self, timeout=None):
+        """Block until everything submitted so far is written; returns False on timeout"""
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout=10.0):
+        """Write pending rows and stop the writer thread"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def stats(self):
+        """Return queue depth and write counters"""
+        with self._lock:
+            return {
+                'pending': self._queue.qsize(),
+                'submitted': self.submitted,
+                'written': self.written,
+                'failed': self.failed,
+                'batches': self.batches
+            }
+
+
+_shared_queue = None
+_shared_queue_lock = threading.Lock()
+
+
+def get_write_queue():
+    """Return the process-wide write queue, flushed when the interpreter exits"""
+    global _shared_queue
+    with _shared_queue_lock:
+        if _shared_queue is None:
+            _shared_queue = WriteQueue()
+            atexit.register(_shared_queue.close)
+        return _shared_queue
@@ -4,6 +4,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from config.database import get_database_connection
+from config.query_cache import cached_query
 from io import BytesIO
 
 class DashboardManager:
@@ -34,6 +35,7 @@ class DashboardManager:
             </style>
         """, unsafe_allow_html=True)
 
+    @cached_query(ttl=60, method=True)
     def get_resume_metrics(self):
         """Get resume-related metrics from database"""
         cursor = self.conn.cursor()
@@ -42,50 +44,69 @@ class DashboardManager:
         start_of_week = now - timedelta(days=now.weekday())
         start_of_month = now.replace(day=1)
 
-        metrics = {}
-        for period, start_date in [
+        periods = [
             ('Today', start_of_day),
             ('This Week', start_of_week),
             ('This Month', start_of_month),
             ('All Time', datetime(2000, 1, 1))
-        ]:
-            cursor.execute("""
-                SELECT 
-                    COUNT(DISTINCT rd.id) as total_resumes,
-                    ROUND(AVG(ra.ats_score), 1) as avg_ats_score,
-                    ROUND(AVG(ra.keyword_match_score), 1) as avg_keyword_score,
-                    COUNT(DISTINCT CASE WHEN ra.ats_score >= 70 THEN rd.id END) as high_scoring
-                FROM resume_data rd
-                LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-                WHERE rd.created_at >= ?
-            """, (start_date.strftime('%Y-%m-%d %H:%M:%S'),))
-            
-            row = cursor.fetchone()
-            metrics[period] = {
-                'total': row[0] or 0,
-                'ats_score': row[1] or 0,
-                'keyword_score': row[2] or 0,
-                'high_scoring': row[3] or 0
+        ]
+        params = []
+        for period, start_date in periods:
+            params.extend([period, start_date.strftime('%Y-%m-%d')])
+
+        # One read of the daily_stats rollup answers every period at once
+        cursor.execute("""
+            WITH periods(period, start_day) AS (VALUES (?, ?), (?, ?), (?, ?), (?, ?))
+            SELECT
+                p.period,
+                SUM(ds.resumes) as total_resumes,
+                ROUND(SUM(ds.ats_sum) / NULLIF(SUM(ds.ats_count), 0), 1) as avg_ats_score,
+                ROUND(SUM(ds.keyword_sum) / NULLIF(SUM(ds.keyword_count), 0), 1) as avg_keyword_score,
+                SUM(ds.high_scoring) as high_scoring
+            FROM periods p
+            LEFT JOIN daily_stats ds ON ds.day >= p.start_day
+            GROUP BY p.period
+        """, params)
+
+        metrics = {}
+        for row in cursor.fetchall():
+            metrics[row[0]] = {
+                'total': row[1] or 0,
+                'ats_score': row[2] or 0,
+                'keyword_score': row[3] or 0,
+                'high_scoring': row[4] or 0
             }
         
         return metrics
 
-    def get_skill_distribution(self):
-        """Get skill distribution data"""
+    @cached_query(ttl=300, method=True)
+    def get_skill_distribution(self, limit=10, target_role=None, days=None):
+        """Get the most common skills, optionally for one target role and the last ``days`` days"""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            WITH RECURSIVE split(skill, rest) AS (
-                SELECT '', skills || ',' FROM resume_data
-                UNION ALL
-                SELECT substr(rest, 0, instr(rest, ',')), substr(rest, instr(rest, ',') + 1)
-                FROM split WHERE rest <> ''
-            )
-            SELECT skill, COUNT(*) as count
-            FROM split WHERE skill <> ''
-            GROUP BY skill
-            ORDER BY count DESC
-            LIMIT 10
-        """)
+        if target_role is None and days is None:
+            # Top-K straight from the skill_totals index
+            cursor.execute("""
+                SELECT skill_name, resumes as count
+                FROM skill_totals
+                ORDER BY resumes DESC
+                LIMIT ?
+            """, (limit,))
+        else:
+            conditions, params = [], []
+            if target_role is not None:
+                conditions.append("target_role = ?")
+                params.append(target_role)
+            if days is not None:
+                conditions.append("day >= ?")
+                params.append((datetime.now() - timedelta(days=days - 1)).strftime('%Y-%m-%d'))
+            cursor.execute(f"""
+                SELECT MIN(skill_name), SUM(resumes) as count
+                FROM skill_stats
+                WHERE {' AND '.join(conditions)}
+                GROUP BY skill_key
+                ORDER BY count DESC
+                LIMIT ?
+            """, (*params, limit))
         
         skills, counts = [], []
         for row in cursor.fetchall():
@@ -94,17 +115,32 @@ class DashboardManager:
             
         return skills, counts
 
+    @cached_query(ttl=60, method=True)
+    def get_submission_trends(self, days=7, bucket_days=1):
+        """Get submission counts for the last ``days`` days, summed into buckets of ``bucket_days``"""
+        cursor = self.conn.cursor()
+        today = datetime.now().date()
+        start = today - timedelta(days=days - 1)
+
+        # Range read on the daily_stats primary key; days without submissions have no row
+        cursor.execute(
+            "SELECT day, resumes FROM daily_stats WHERE day BETWEEN ? AND ?",
+            (start.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d'))
+        )
+        counts = dict(cursor.fetchall())
+
+        dates = [(start + timedelta(days=x)).strftime('%Y-%m-%d') for x in range(days)]
+        labels, submissions = [], []
+        for i in range(0, days, bucket_days):
+            bucket = dates[i:i + bucket_days]
+            labels.append(bucket[0])
+            submissions.append(sum(counts.get(date, 0) for date in bucket))
+
+        return labels, submissions
+
     def get_weekly_trends(self):
         """Get weekly submission trends"""
-        cursor = self.conn.cursor()
-        now = datetime.now()
-        dates = [(now - timedelta(days=x)).strftime('%Y-%m-%d') for x in range(6, -1, -1)]
-        
-        submissions = []
-        for date in dates:
-            cursor.execute("SELECT COUNT(*) FROM resume_data WHERE DATE(created_at) = DATE(?)", (date,))
-            submissions.append(cursor.fetchone()[0])
-            
+        dates, submissions = self.get_submission_trends(days=7)
         return [d[-3:] for d in dates], submissions
 
     def render_dashboard(self):
@@ -1,14 +1,36 @@
-import spacy
 from collections import Counter
 from datetime import datetime
+from resume_analytics.models import DEFAULT_MODEL, get_nlp
+from resume_analytics.skill_matcher import DEFAULT_SKILLS, get_skill_matcher
 
 class ResumeAnalyzer:
-    def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, model_name=DEFAULT_MODEL, skills=DEFAULT_SKILLS):
+        self.model_name = model_name
+        # Skill vocabulary, e.g. from skill_matcher.load_skill_vocabulary
+        self.skills = tuple(skills)
+
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline, loaded lazily on first use"""
+        return get_nlp(self.model_name)
         
     def analyze_resume(self, resume_text):
         """Analyze resume text and return metrics"""
-        doc = self.nlp(resume_text)
+        return self._analyze_doc(self.nlp(resume_text))
+
+    def analyze_many(self, texts, batch_size=64, n_process=1):
+        """Analyze an iterable of resume texts, yielding results in input order.
+
+        Documents are processed in batches with nlp.pipe, optionally across
+        ``n_process`` worker processes, and each result is yielded as soon as
+        its batch is done so large collections can be streamed.
+        """
+        for doc in self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            yield self._analyze_doc(doc)
+
+    def _analyze_doc(self, doc):
+        """Compute metrics for a processed spaCy document"""
+        resume_text = doc.text
         
         # Basic metrics
         word_count = len(resume_text.split())
@@ -42,24 +64,7 @@ class ResumeAnalyzer:
     
     def _extract_skills(self, doc):
         """Extract skills from resume"""
-        # Common technical skills keywords
-        tech_skills = {
-            "python", "java", "javascript", "react", "node.js", "sql",
-            "html", "css", "aws", "docker", "kubernetes", "git",
-            "machine learning", "ai", "data science", "analytics"
-        }
-        
-        skills = set()
-        for token in doc:
-            if token.text.lower() in tech_skills:
-                skills.add(token.text)
-            # Check for compound skills (e.g., "machine learning")
-            if token.i < len(doc) - 1:
-                bigram = (token.text + " " + doc[token.i + 1].text).lower()
-                if bigram in tech_skills:
-                    skills.add(bigram)
-        
-        return skills
+        return get_skill_matcher(self.model_name, self.skills).extract(doc)
     
     def _analyze_experience(self, doc):
         """Analyze years of experience"""
@@ -0,0 +1,35 @@
+import threading
+import spacy
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+# The analyzers only read tokens, lexical attributes and sentence boundaries,
+# so entity recognition and lemmatization are never loaded
+UNUSED_PIPES = ("ner", "lemmatizer")
+
+_models = {}
+_lock = threading.Lock()
+
+
+def get_nlp(model_name=DEFAULT_MODEL, exclude=UNUSED_PIPES):
+    """Return the shared pipeline for a model, loading it on first use.
+
+    Pipelines are cached per process and keyed on the model name and the
+    excluded components, so every analyzer, session and thread reuses the
+    same loaded model.
+    """
+    key = (model_name, tuple(sorted(exclude)))
+    nlp = _models.get(key)
+    if nlp is None:
+        with _lock:
+            nlp = _models.get(key)
+            if nlp is None:
+                nlp = spacy.load(model_name, exclude=list(exclude))
+                _models[key] = nlp
+    return nlp
+
+
+def clear_models():
+    """Drop all cached pipelines so the next get_nlp call reloads them"""
+    with _lock:
+        _models.clear()
@@ -0,0 +1,64 @@
+import json
+import threading
+from spacy.matcher import PhraseMatcher
+from resume_analytics.models import get_nlp
+
+# Common technical skills keywords
+DEFAULT_SKILLS = (
+    "python", "java", "javascript", "react", "node.js", "sql",
+    "html", "css", "aws", "docker", "kubernetes", "git",
+    "machine learning", "ai", "data science", "analytics"
+)
+
+_matchers = {}
+_lock = threading.Lock()
+
+
+def load_skill_vocabulary(path):
+    """Load skills from a JSON list or a text file with one skill per line"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            skills = json.load(f)
+        else:
+            skills = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    return tuple(skills)
+
+
+class SkillMatcher:
+    """Token-level skill extractor compiled once from a skill vocabulary.
+
+    Every skill is tokenized with the pipeline's tokenizer and added to a
+    case-insensitive PhraseMatcher, so skills of any length are found in a
+    single pass over a document regardless of vocabulary size.
+    """
+
+    def __init__(self, nlp, skills=DEFAULT_SKILLS):
+        self.matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        self.strings = nlp.vocab.strings
+        seen = set()
+        unique_skills = []
+        for skill in skills:
+            if skill and skill.lower() not in seen:
+                seen.add(skill.lower())
+                unique_skills.append(skill)
+        # Patterns only need tokenization, not the full pipeline
+        for skill, pattern in zip(unique_skills, nlp.tokenizer.pipe(unique_skills)):
+            self.matcher.add(skill, [pattern])
+        self.skills = tuple(unique_skills)
+
+    def extract(self, doc):
+        """Return the set of vocabulary skills mentioned in a document"""
+        return {self.strings[match_id] for match_id, start, end in self.matcher(doc)}
+
+
+def get_skill_matcher(model_name, skills=DEFAULT_SKILLS):
+    """Return the shared matcher for a model and skill vocabulary, building it on first use"""
+    key = (model_name, tuple(skills))
+    matcher = _matchers.get(key)
+    if matcher is None:
+        with _lock:
+            matcher = _matchers.get(key)
+            if matcher is None:
+                matcher = SkillMatcher(get_nlp(model_name), key[1])
+                _matchers[key] = matcher
+    return matcher
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from utils.resume_analyzer import analyzer_version
+
+
+class AnalysisCache:
+    """Two-tier cache of resume analyses keyed on the uploaded file's content.
+
+    The key combines the SHA-256 of the file bytes, the analyzer version (with
+    the skill embedding index in use) and the target role, so re-uploads of the same file and Streamlit reruns reuse
+    the stored result while analyzer changes invalidate it. Entries live in an
+    in-memory LRU and, when ``db_path`` is given, in a SQLite table that evicts
+    the least recently used rows once it grows past ``max_db_bytes``.
+    """
+
+    def __init__(self, max_entries=256, db_path=None, max_db_bytes=50 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.max_db_bytes = max_db_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if db_path:
+            self._init_db()
+
+    @staticmethod
+    def make_key(file_bytes, role=None, version=None):
+        """Build the cache key for a file's bytes, analyzer version and role"""
+        version = version or analyzer_version()
+        digest = hashlib.sha256(file_bytes).hexdigest()
+        return f"{digest}:{version}:{role or ''}"
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _init_db(self):
+        conn = self._connect()
+        try:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                cache_key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_analysis_cache_accessed_at ON analysis_cache (accessed_at)')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached analysis for ``key`` or None"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+        if self.db_path:
+            conn = self._connect()
+            try:
+                row = conn.execute('SELECT value FROM analysis_cache WHERE cache_key = ?', (key,)).fetchone()
+                if row:
+                    conn.execute('UPDATE analysis_cache SET accessed_at = ? WHERE cache_key = ?', (time.time(), key))
+                    conn.commit()
+            except Exception as e:
+                print(f"Error reading analysis cache: {str(e)}")
+                row = None
+            finally:
+                conn.close()
+            if row:
+                value = json.loads(row[0])
+                self._remember(key, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, value):
+        """Store an analysis in both tiers"""
+        self._remember(key, value)
+        if not self.db_path:
+            return
+
+        conn = self._connect()
+        try:
+            payload = json.dumps(value, default=str)
+            conn.execute('''
+            INSERT OR REPLACE INTO analysis_cache (cache_key, value, size, accessed_at)
+            VALUES (?, ?, ?, ?)
+            ''', (key, payload, len(payload), time.time()))
+            self._evict(conn)
+            conn.commit()
+        except Exception as e:
+            print(f"Error writing analysis cache: {str(e)}")
+            conn.rollback()
+        finally:
+            conn.close()
+
+    def _evict(self, conn):
+        """Drop least recently used rows until the disk tier fits in max_db_bytes"""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM analysis_cache').fetchone()[0]
+        if total <= self.max_db_bytes:
+            return
+        freed = 0
+        expired = []
+        for key, size in conn.execute('SELECT cache_key, size FROM analysis_cache ORDER BY accessed_at'):
+            if total - freed <= self.max_db_bytes:
+                break
+            expired.append((key,))
+            freed += size
+        conn.executemany('DELETE FROM analysis_cache WHERE cache_key = ?', expired)
+
+    def get_or_compute(self, file_bytes, role, compute):
+        """Return the cached analysis for these bytes and role, computing it on a miss"""
+        key = self.make_key(file_bytes, role)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self.db_path:
+            conn = self._connect()
+            try:
+                conn.execute('DELETE FROM analysis_cache')
+                conn.commit()
+            finally:
+                conn.close()
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_analysis_cache():
+    """Return the process-wide cache shared by all Streamlit sessions.
+
+    The disk tier is enabled by pointing ANALYSIS_CACHE_DB at a SQLite file.
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = AnalysisCache(db_path=os.environ.get('ANALYSIS_CACHE_DB'))
+        return _shared_cache
@@ -0,0 +1,251 @@
+"""Headless bulk analysis of resume dumps.
+
+Usage:
+    python -m utils.bulk_analyzer resumes/ --output results.jsonl
+    python -m utils.bulk_analyzer resume.pdf
+    python -m utils.bulk_analyzer campus_drive.zip --output results.db --role "Data Scientist"
+
+Files are fanned out to a process pool; every worker builds its own
+ResumeAnalyzer once and reuses it to extract and score all files it is given.
+Results are streamed to JSONL or SQLite as they complete.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+import zipfile
+from io import BytesIO
+from multiprocessing import Pool, util
+
+from config.role_index import get_role_requirements, resolve_role
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.resume_parser import MAX_PDF_BYTES
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+# Per-process state, created by _init_worker
+_analyzer = None
+_archives = {}
+
+
+def iter_resume_files(path):
+    """Yield (source, member) pairs for a single resume, a directory of resumes or a zip"""
+    # Checked first: a .docx is itself a zip archive
+    if os.path.isfile(path) and path.lower().endswith(SUPPORTED_EXTENSIONS):
+        yield path, None
+        return
+
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.namelist():
+                if member.lower().endswith(SUPPORTED_EXTENSIONS):
+                    yield path, member
+        return
+
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield os.path.join(root, name), None
+
+
+def _init_worker():
+    global _analyzer
+    _analyzer = ResumeAnalyzer()
+    # Runs when the worker exits normally, i.e. after pool.close() and join()
+    util.Finalize(None, _close_archives, exitpriority=10)
+
+
+def _close_archives():
+    for archive in _archives.values():
+        archive.close()
+    _archives.clear()
+
+
+def _open_resume(source, member):
+    if member is None:
+        return open(source, 'rb')
+    archive = _archives.get(source)
+    if archive is None:
+        archive = _archives[source] = zipfile.ZipFile(source)
+    # Parsers expect a seekable binary file, which a ZipExtFile is not
+    size = archive.getinfo(member).file_size
+    if size > MAX_PDF_BYTES:
+        raise ValueError(f"File is {size} bytes, larger than the {MAX_PDF_BYTES} byte limit")
+    return BytesIO(archive.read(member))
+
+
+def analyze_file(task):
+    """Extract and analyze one resume; runs inside a pool worker"""
+    source, member, role, job_requirements, top_k = task
+    name = f"{source}::{member}" if member else source
+    started = time.perf_counter()
+    try:
+        with _open_resume(source, member) as file:
+            if (member or source).lower().endswith('.pdf'):
+                text = _analyzer.extract_text_from_pdf(file)
+            else:
+                text = _analyzer.extract_text_from_docx(file)
+        if not text:
+            raise ValueError("No text could be extracted")
+
+        resume_data = {'raw_text': text}
+        result = {'file': name, 'status': 'ok'}
+        if job_requirements is not None:
+            analysis = _analyzer.analyze_resume(resume_data, job_requirements)
+            result.update({
+                'role': role,
+                'document_type': analysis['document_type'],
+                'ats_score': analysis['ats_score'],
+                'analysis': analysis
+            })
+        else:
+            ranked = _analyzer.analyze_resume_all_roles(resume_data, top_k=top_k)
+            result.update({
+                'document_type': 'resume' if ranked else _analyzer.detect_document_type(text),
+                'ats_score': ranked[0]['ats_score'] if ranked else 0,
+                'role': ranked[0]['role'] if ranked else None,
+                'ranked_roles': ranked
+            })
+    except Exception as e:
+        result = {'file': name, 'status': 'error', 'error': str(e)}
+
+    result['seconds'] = round(time.perf_counter() - started, 4)
+    return result
+
+
+class JsonlWriter:
+    def __init__(self, path):
+        self.file = sys.stdout if path == '-' else open(path, 'w', encoding='utf-8')
+
+    def write(self, result):
+        self.file.write(json.dumps(result, default=str) + '\n')
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+class SqliteWriter:
+    def __init__(self, path, commit_every=500):
+        self.conn = sqlite3.connect(path)
+        self.commit_every = commit_every
+        self.pending = 0
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS bulk_analysis (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            file TEXT NOT NULL,
+            status TEXT NOT NULL,
+            document_type TEXT,
+            ats_score REAL,
+            role TEXT,
+            result TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+
+    def write(self, result):
+        self.conn.execute('''
+        INSERT INTO bulk_analysis (file, status, document_type, ats_score, role, result)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ''', (
+            result['file'],
+            result['status'],
+            result.get('document_type'),
+            result.get('ats_score'),
+            result.get('role'),
+            json.dumps(result, default=str)
+        ))
+        self.pending += 1
+        if self.pending >= self.commit_every:
+            self.conn.commit()
+            self.pending = 0
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+def open_writer(path):
+    if path.lower().endswith(('.db', '.sqlite', '.sqlite3')):
+        return SqliteWriter(path)
+    return JsonlWriter(path)
+
+
+def run_bulk_analysis(path, output, workers=None, role=None, top_k=5, chunksize=8, progress_every=2.0):
+    """Analyze every resume under ``path`` and stream results to ``output``.
+
+    Returns a summary dict with file, error and throughput counts.
+    """
+    job_requirements = None
+    if role:
+        job_requirements = get_role_requirements(role)
+        if job_requirements is None:
+            raise ValueError(f"Unknown role: {role}")
+        role = resolve_role(role)
+
+    tasks = ((source, member, role, job_requirements, top_k) for source, member in iter_resume_files(path))
+    writer = open_writer(output)
+    processed = errors = 0
+    started = last_report = time.perf_counter()
+
+    try:
+        with Pool(processes=workers, initializer=_init_worker) as pool:
+            for result in pool.imap_unordered(analyze_file, tasks, chunksize=chunksize):
+                writer.write(result)
+                processed += 1
+                if result['status'] != 'ok':
+                    errors += 1
+
+                now = time.perf_counter()
+                if now - last_report >= progress_every:
+                    last_report = now
+                    rate = processed / (now - started)
+                    print(f"Processed {processed} files ({rate:.1f} files/s, {errors} errors)", file=sys.stderr)
+            # Let workers exit on their own so their open archives are closed
+            pool.close()
+            pool.join()
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        'processed': processed,
+        'errors': errors,
+        'seconds': round(elapsed, 2),
+        'files_per_second': round(processed / elapsed, 2) if elapsed else 0
+    }
+    print(f"Done: {processed} files in {summary['seconds']}s "
+          f"({summary['files_per_second']} files/s, {errors} errors)", file=sys.stderr)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze a directory or zip of PDF/DOCX resumes")
+    parser.add_argument('path', help="Resume file, or a directory or .zip archive containing resumes")
+    parser.add_argument('--output', '-o', default='-',
+                        help="JSONL file, '-' for stdout, or a .db/.sqlite file for SQLite output")
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument('--role', help="Score against this JOB_ROLES role instead of ranking all roles")
+    parser.add_argument('--top-k', type=int, default=5, help="Number of ranked roles to keep per resume")
+    parser.add_argument('--chunksize', type=int, default=8, help="Files handed to a worker at a time")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        parser.error(f"Path not found: {args.path}")
+    if not (os.path.isdir(args.path) or zipfile.is_zipfile(args.path)
+            or args.path.lower().endswith(SUPPORTED_EXTENSIONS)):
+        parser.error(f"Not a resume file, directory or zip archive: {args.path}")
+
+    try:
+        run_bulk_analysis(args.path, args.output, workers=args.workers, role=args.role,
+                          top_k=args.top_k, chunksize=args.chunksize)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == '__main__':
+    main()
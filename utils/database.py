@@ -1,7 +1,9 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, DateTime
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
+from contextlib import contextmanager
 import datetime
+import threading
 
 # Create the base class for declarative models
 Base = declarative_base()
@@ -11,7 +13,7 @@ class Resume(Base):
     __tablename__ = 'resumes'
     
     id = Column(Integer, primary_key=True)
-    user_id = Column(String(100))
+    user_id = Column(String(100), index=True)
     job_role = Column(String(100))
     content = Column(Text)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
@@ -22,47 +24,140 @@ class Analysis(Base):
     __tablename__ = 'analyses'
     
     id = Column(Integer, primary_key=True)
-    resume_id = Column(Integer)
+    resume_id = Column(Integer, index=True)
     analysis_data = Column(Text)  # Store JSON data
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
+# Connection pool settings shared by every engine
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
+POOL_TIMEOUT = 30
+SQLITE_BUSY_TIMEOUT = 10
+
+# One engine and session registry per database file, shared by all threads
+_engines = {}
+_sessions = {}
+_engines_lock = threading.Lock()
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
+
+def _create_engine(db_path):
+    engine = create_engine(
+        f'sqlite:///{db_path}',
+        # Pooled connections are handed between Streamlit threads
+        connect_args={'check_same_thread': False, 'timeout': SQLITE_BUSY_TIMEOUT},
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        pool_pre_ping=True
+    )
+    event.listen(engine, 'connect', _set_sqlite_pragmas)
+    Base.metadata.create_all(engine)
+    # create_all skips tables that already exist, so add their new indexes explicitly
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    return engine
+
+def get_engine(db_path='resume_data.db'):
+    """Return the process-wide engine for a database file, creating it on first use"""
+    with _engines_lock:
+        if db_path not in _engines:
+            _engines[db_path] = _create_engine(db_path)
+        return _engines[db_path]
+
+def get_session_registry(db_path='resume_data.db'):
+    """Return the thread-local session registry for a database file"""
+    engine = get_engine(db_path)
+    with _engines_lock:
+        if db_path not in _sessions:
+            # Objects stay readable after commit, once their session has closed
+            _sessions[db_path] = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
+        return _sessions[db_path]
+
 class DatabaseManager:
     def __init__(self, db_path='resume_data.db'):
-        self.engine = create_engine(f'sqlite:///{db_path}')
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
-    
+        self.engine = get_engine(db_path)
+        self.Session = get_session_registry(db_path)
+
+    @property
+    def session(self):
+        """The calling thread's session"""
+        return self.Session()
+
+    @contextmanager
+    def session_scope(self):
+        """Run one unit of work, committing on success and rolling back on error"""
+        session = self.Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self.Session.remove()
+
     def save_resume(self, user_id, job_role, content):
-        resume = Resume(
-            user_id=user_id,
-            job_role=job_role,
-            content=content
-        )
-        self.session.add(resume)
-        self.session.commit()
-        return resume.id
-    
+        with self.session_scope() as session:
+            resume = Resume(
+                user_id=user_id,
+                job_role=job_role,
+                content=content
+            )
+            session.add(resume)
+            session.flush()
+            return resume.id
+
+    def save_resumes(self, resumes):
+        """Insert many resumes in one transaction and return their ids.
+
+        ``resumes`` is an iterable of dicts with user_id, job_role and content.
+        """
+        mappings = [dict(resume) for resume in resumes]
+        with self.session_scope() as session:
+            session.bulk_insert_mappings(Resume, mappings, return_defaults=True)
+        return [mapping['id'] for mapping in mappings]
+
     def get_resume(self, resume_id):
-        return self.session.query(Resume).filter(Resume.id == resume_id).first()
-    
+        with self.session_scope() as session:
+            return session.get(Resume, resume_id)
+
     def get_user_resumes(self, user_id):
-        return self.session.query(Resume).filter(Resume.user_id == user_id).all()
-    
+        with self.session_scope() as session:
+            return session.query(Resume).filter(Resume.user_id == user_id).all()
+
     def save_analysis(self, resume_id, analysis_data):
-        analysis = Analysis(
-            resume_id=resume_id,
-            analysis_data=analysis_data
-        )
-        self.session.add(analysis)
-        self.session.commit()
-        return analysis.id
-    
+        with self.session_scope() as session:
+            analysis = Analysis(
+                resume_id=resume_id,
+                analysis_data=analysis_data
+            )
+            session.add(analysis)
+            session.flush()
+            return analysis.id
+
+    def save_analyses(self, analyses):
+        """Insert many analyses in one transaction and return their ids.
+
+        ``analyses`` is an iterable of dicts with resume_id and analysis_data.
+        """
+        mappings = [dict(analysis) for analysis in analyses]
+        with self.session_scope() as session:
+            session.bulk_insert_mappings(Analysis, mappings, return_defaults=True)
+        return [mapping['id'] for mapping in mappings]
+
     def get_analysis(self, analysis_id):
-        return self.session.query(Analysis).filter(Analysis.id == analysis_id).first()
-    
+        with self.session_scope() as session:
+            return session.get(Analysis, analysis_id)
+
     def get_resume_analyses(self, resume_id):
-        return self.session.query(Analysis).filter(Analysis.resume_id == resume_id).all()
-    
+        with self.session_scope() as session:
+            return session.query(Analysis).filter(Analysis.resume_id == resume_id).all()
+
     def close(self):
-        self.session.close()
+        self.Session.remove()
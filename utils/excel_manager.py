@@ -1,43 +1,136 @@
+import os
+import sqlite3
+import threading
 import pandas as pd
 from datetime import datetime
 
+EXCEL_COLUMNS = ['user_id', 'job_role', 'content', 'analysis_data', 'created_at']
+
 class ExcelManager:
-    def __init__(self):
-        self.excel_file = "resume_data.xlsx"
-    
+    """Resume store that appends to a SQLite journal and compacts into XLSX on demand.
+
+    Saves are single-row inserts instead of rewriting the workbook, and
+    concurrent sessions are serialized by SQLite. The workbook is rebuilt from
+    the journal by compact() or, without blocking the caller, compact_async().
+    An existing workbook is imported into the journal the first time it is opened.
+    """
+    _compact_lock = threading.Lock()
+
+    def __init__(self, excel_file="resume_data.xlsx", journal_file="resume_data_journal.db"):
+        self.excel_file = excel_file
+        self.journal_file = journal_file
+        self._init_journal()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.journal_file, timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def _init_journal(self):
+        conn = self._connect()
+        try:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS resume_journal (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id,
+                job_role TEXT,
+                content TEXT,
+                analysis_data TEXT,
+                created_at TEXT
+            )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_resume_journal_user_id ON resume_journal (user_id)')
+            conn.commit()
+
+            # user_version marks that the legacy workbook has been imported
+            conn.execute('BEGIN IMMEDIATE')
+            if conn.execute('PRAGMA user_version').fetchone()[0] == 0:
+                self._import_workbook(conn)
+                conn.execute('PRAGMA user_version = 1')
+            conn.commit()
+        except Exception as e:
+            print(f"Error initializing resume journal: {str(e)}")
+            conn.rollback()
+        finally:
+            conn.close()
+
+    def _import_workbook(self, conn):
+        """Copy rows from a workbook written by the old read-modify-write store"""
+        if not os.path.exists(self.excel_file):
+            return
+        df = pd.read_excel(self.excel_file).reindex(columns=EXCEL_COLUMNS)
+        df = df.astype(object).where(df.notna(), None)
+        conn.executemany(
+            'INSERT INTO resume_journal (user_id, job_role, content, analysis_data, created_at) VALUES (?, ?, ?, ?, ?)',
+            df.itertuples(index=False, name=None)
+        )
+
     def save_resume_data(self, user_id, job_role, content, analysis_data=None):
+        conn = self._connect()
         try:
-            # Try to read existing Excel file
-            try:
-                df = pd.read_excel(self.excel_file)
-            except FileNotFoundError:
-                df = pd.DataFrame()
-            
-            # Create new data entry
-            new_data = {
-                'user_id': user_id,
-                'job_role': job_role,
-                'content': content,
-                'analysis_data': str(analysis_data) if analysis_data else None,
-                'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            # Append new data
-            df = pd.concat([df, pd.DataFrame([new_data])], ignore_index=True)
-            
-            # Save to Excel
-            df.to_excel(self.excel_file, index=False)
+            conn.execute(
+                'INSERT INTO resume_journal (user_id, job_role, content, analysis_data, created_at) VALUES (?, ?, ?, ?, ?)',
+                (user_id, job_role, content,
+                 str(analysis_data) if analysis_data else None,
+                 datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            )
+            conn.commit()
             return True
         except Exception as e:
-            print(f"Error saving to Excel: {str(e)}")
+            print(f"Error saving to resume journal: {str(e)}")
+            conn.rollback()
             return False
-    
-    def get_all_resumes(self):
+        finally:
+            conn.close()
+
+    def _read_journal(self, where='', params=()):
+        conn = self._connect()
         try:
-            return pd.read_excel(self.excel_file)
-        except FileNotFoundError:
-            return pd.DataFrame()
-    
+            return pd.read_sql_query(
+                f"SELECT {', '.join(EXCEL_COLUMNS)} FROM resume_journal {where} ORDER BY id",
+                conn, params=params
+            )
+        finally:
+            conn.close()
+
+    def get_all_resumes(self):
+        return self._read_journal()
+
     def get_user_resumes(self, user_id):
-        df = self.get_all_resumes()
-        return df[df['user_id'] == user_id]
+        # Served from the user_id index rather than a full sheet read
+        return self._read_journal('WHERE user_id = ?', (user_id,))
+
+    def compact(self):
+        """Rewrite the XLSX file from the journal and return the number of rows written"""
+        from openpyxl import Workbook
+
+        with self._compact_lock:
+            conn = self._connect()
+            try:
+                workbook = Workbook(write_only=True)
+                sheet = workbook.create_sheet('Sheet1')
+                sheet.append(EXCEL_COLUMNS)
+                count = 0
+                for row in conn.execute(f"SELECT {', '.join(EXCEL_COLUMNS)} FROM resume_journal ORDER BY id"):
+                    sheet.append(row)
+                    count += 1
+            finally:
+                conn.close()
+
+            # Write beside the target and swap it in so readers never see a partial file
+            temp_file = f"{self.excel_file}.tmp"
+            workbook.save(temp_file)
+            os.replace(temp_file, self.excel_file)
+            return count
+
+    def compact_async(self):
+        """Run compact() in a background thread and return the thread"""
+        def run():
+            try:
+                self.compact()
+            except Exception as e:
+                print(f"Error compacting resume workbook: {str(e)}")
+
+        thread = threading.Thread(target=run, name='excel-compaction', daemon=True)
+        thread.start()
+        return thread
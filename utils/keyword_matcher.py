@@ -0,0 +1,117 @@
+import re
+from functools import lru_cache
+
+
+class KeywordMatcher:
+    """Find every keyword of a fixed vocabulary in a text with a single scan.
+
+    The keywords are folded into one trie-shaped regular expression wrapped in
+    a lookahead, so the regex engine tries each text position once and returns
+    the longest keyword starting there. Shorter keywords that are prefixes of
+    that longest match are recovered from a precomputed table, which makes the
+    result identical to running ``keyword in text`` for every keyword.
+    """
+
+    # With word_boundaries, a keyword must not sit inside a longer word or token
+    # such as "r" in "gardening" or "js" in "node.js"
+    _BOUNDARY_BEFORE = r'(?<![\w+#.])'
+    _BOUNDARY_AFTER = r'(?![\w+#])'
+
+    def __init__(self, keywords, word_boundaries=False):
+        self.word_boundaries = word_boundaries
+        self.keywords = sorted({keyword.lower() for keyword in keywords if keyword})
+        self.keyword_set = frozenset(self.keywords)
+        # For every keyword, the keywords (itself included) that are its prefixes
+        self._prefixes = {
+            keyword: tuple(other for other in self.keywords if keyword.startswith(other))
+            for keyword in self.keywords
+        }
+        self._pattern = None
+        if self.keywords:
+            trie_pattern = self._build_trie_pattern(self.keywords)
+            if word_boundaries:
+                self._pattern = re.compile(self._BOUNDARY_BEFORE + '(?=(' + trie_pattern + ')' + self._BOUNDARY_AFTER + ')')
+                self._boundary_after = re.compile(self._BOUNDARY_AFTER)
+            else:
+                self._pattern = re.compile('(?=(' + trie_pattern + '))')
+
+    @staticmethod
+    def _build_trie_pattern(keywords):
+        """Build a regex alternation factored by common prefixes"""
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def to_pattern(node):
+            is_terminal = '' in node
+            branches = [re.escape(char) + to_pattern(child)
+                        for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            if is_terminal:
+                # Greedy optional group: prefer the longer keyword, fall back to this one
+                return '(?:' + body + ')?'
+            return body
+
+        return to_pattern(trie)
+
+    def iter_matches(self, text):
+        """Yield ``(start, end, keyword)`` for every keyword occurrence in ``text``"""
+        if self._pattern is None:
+            return
+        text = text.lower()
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for keyword in self._keywords_at(text, start, match.group(1)):
+                yield start, start + len(keyword), keyword
+
+    def _keywords_at(self, text, start, longest):
+        """Keywords starting at ``start``: the longest match and those of its prefixes that qualify"""
+        prefixes = self._prefixes[longest]
+        if not self.word_boundaries:
+            return prefixes
+        return [keyword for keyword in prefixes
+                if self._boundary_after.match(text, start + len(keyword))]
+
+    def find_all(self, text):
+        """Return the set of keywords occurring anywhere in ``text``"""
+        found = set()
+        if self._pattern is None:
+            return found
+        text = text.lower()
+        for match in self._pattern.finditer(text):
+            found.update(self._keywords_at(text, match.start(), match.group(1)))
+        return found
+
+    def find_positions(self, text):
+        """Return a dict mapping each keyword found in ``text`` to its (start, end) spans"""
+        positions = {}
+        for start, end, keyword in self.iter_matches(text):
+            positions.setdefault(keyword, []).append((start, end))
+        return positions
+
+
+@lru_cache(maxsize=128)
+def get_keyword_matcher(keywords, word_boundaries=False):
+    """Return a cached matcher for a tuple of keywords"""
+    return KeywordMatcher(keywords, word_boundaries)
+
+
+@lru_cache(maxsize=1)
+def get_role_skills_matcher():
+    """Return the matcher over the required skills of every role in JOB_ROLES.
+
+    Built once per process; scoring a resume against any number of roles then
+    needs a single scan of the text.
+    """
+    from config.job_roles import JOB_ROLES
+
+    skills = set()
+    for roles in JOB_ROLES.values():
+        for role_info in roles.values():
+            skills.update(role_info.get('required_skills', []))
+    return KeywordMatcher(skills)
@@ -1,4 +1,18 @@
 import re
+from functools import lru_cache
+import numpy as np
+from utils.keyword_matcher import KeywordMatcher, get_keyword_matcher, get_role_skills_matcher
+from utils.skill_embeddings import get_skill_index
+
+# Bump whenever analysis output changes so cached results are recomputed
+ANALYZER_VERSION = '1.1'
+
+def analyzer_version():
+    """ANALYZER_VERSION plus the skill index in use, which also changes keyword results"""
+    skill_index = get_skill_index()
+    if skill_index is None:
+        return ANALYZER_VERSION
+    return f"{ANALYZER_VERSION}+skills.{skill_index.fingerprint}"
 
 class ResumeAnalyzer:
     def __init__(self):
@@ -21,6 +35,63 @@ class ResumeAnalyzer:
                 'date of issue', 'identification'
             ]
         }
+
+        # Section header keywords used by the extract_* methods
+        self.section_keywords = {
+            'education': [
+                'education', 'academic', 'qualification', 'degree', 'university', 'college',
+                'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
+                'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
+                'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
+            ],
+            'experience': [
+                'experience', 'employment', 'work history', 'professional experience',
+                'work experience', 'career history', 'professional background',
+                'employment history', 'job history', 'positions held', 'experience',
+                'job title', 'job responsibilities', 'job description', 'job summary'
+            ],
+            'projects': [
+                'projects', 'personal projects', 'academic projects', 'key projects',
+                'major projects', 'professional projects', 'project experience',
+                'relevant projects', 'featured projects','latest projects',
+                'top projects'
+            ],
+            'skills': [
+                'skills', 'technical skills', 'competencies', 'expertise',
+                'core competencies', 'professional skills', 'key skills',
+                'technical expertise', 'proficiencies', 'qualifications',
+                'top skills', 'key skill', 'major skill', 'personal skill',
+                'soft skills', 'soft skill', 'soft skillset'
+            ],
+            'summary': [
+                'summary', 'professional summary', 'career summary', 'objective',
+                'career objective', 'professional objective', 'about me', 'profile',
+                'professional profile', 'career profile', 'overview', 'skill summary'
+            ]
+        }
+
+        # Keywords scored by check_resume_sections
+        self.essential_sections = {
+            'contact': ['email', 'phone', 'address', 'linkedin'],
+            'education': ['education', 'university', 'college', 'degree', 'academic'],
+            'experience': ['experience', 'work', 'employment', 'job', 'internship'],
+            'skills': ['skills', 'technologies', 'tools', 'proficiencies', 'expertise']
+        }
+
+        # One matcher for every header keyword, shared by all sections
+        self._section_keyword_sets = {
+            section: frozenset(keyword.lower() for keyword in keywords)
+            for section, keywords in self.section_keywords.items()
+        }
+        self._resume_keyword_set = frozenset(self.document_types['resume'])
+        header_keywords = set(self._resume_keyword_set)
+        for keywords in self._section_keyword_sets.values():
+            header_keywords.update(keywords)
+        for keywords in self.essential_sections.values():
+            header_keywords.update(keywords)
+        self._header_matcher = KeywordMatcher(header_keywords)
+        self._segment_cache = None
+        self._skill_scan_cache = None
         
     def detect_document_type(self, text):
         text = text.lower()
@@ -39,42 +110,66 @@ class ResumeAnalyzer:
         # Only return a document type if the score is significant
         return best_match[0] if best_match[1] > 0.15 else 'unknown'
         
-    def calculate_keyword_match(self, resume_text, required_skills):
-        resume_text = resume_text.lower()
+    def find_skills(self, resume_text, required_skills):
+        """Return the lowercased required skills that occur anywhere in the text.
+
+        A role has a handful of skills, so plain substring checks on the
+        lowercased text (kept for the last text scored) beat any single scan.
+        """
+        cache = self._skill_scan_cache
+        if cache is None or cache[0] is not resume_text:
+            cache = self._skill_scan_cache = (resume_text, resume_text.lower())
+        text_lower = cache[1]
+        return {skill.lower() for skill in required_skills if skill and skill.lower() in text_lower}
+
+    def find_skill_positions(self, resume_text, skills):
+        """Return the (start, end) spans of each skill where it occurs as a whole word"""
+        keywords = tuple(sorted({skill.lower() for skill in skills if skill}))
+        return get_keyword_matcher(keywords, word_boundaries=True).find_positions(resume_text)
+
+    def calculate_keyword_match(self, resume_text, required_skills, with_positions=False):
+        found = self.find_skills(resume_text, required_skills)
         found_skills = []
         missing_skills = []
         
         for skill in required_skills:
             skill_lower = skill.lower()
             # Check for exact match
-            if skill_lower in resume_text:
-                found_skills.append(skill)
-            # Check for partial matches (e.g., "Python" in "Python programming")
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
+            if skill_lower in found or not skill_lower:
                 found_skills.append(skill)
             else:
                 missing_skills.append(skill)
+
+        # Fuzzy pass over the resume's listed skills, only for what the exact scan missed
+        semantic_matches = {}
+        if missing_skills:
+            skill_index = get_skill_index()
+            if skill_index is not None:
+                semantic_matches = skill_index.match_missing(missing_skills, self.extract_skills(resume_text))
+                found_skills.extend(semantic_matches)
+                missing_skills = [skill for skill in missing_skills if skill not in semantic_matches]
                 
         match_score = (len(found_skills) / len(required_skills)) * 100 if required_skills else 0
         
-        return {
+        result = {
             'score': match_score,
             'found_skills': found_skills,
-            'missing_skills': missing_skills
+            'missing_skills': missing_skills,
+            'semantic_matches': semantic_matches
         }
+        if with_positions:
+            # Whole-word spans of the exact matches only, so "R" does not mark every letter r
+            positions = self.find_skill_positions(resume_text, found)
+            result['match_positions'] = {skill: positions[skill.lower()] for skill in found_skills
+                                         if skill.lower() in positions}
+        return result
         
     def check_resume_sections(self, text):
-        text = text.lower()
-        essential_sections = {
-            'contact': ['email', 'phone', 'address', 'linkedin'],
-            'education': ['education', 'university', 'college', 'degree', 'academic'],
-            'experience': ['experience', 'work', 'employment', 'job', 'internship'],
-            'skills': ['skills', 'technologies', 'tools', 'proficiencies', 'expertise']
-        }
-        
+        found_keywords = self.segment_resume(text)['keywords']
+
         section_scores = {}
-        for section, keywords in essential_sections.items():
-            found = sum(1 for keyword in keywords if keyword in text)
+        for section, keywords in self.essential_sections.items():
+            found = sum(1 for keyword in keywords if keyword in found_keywords)
             section_scores[section] = min(25, (found / len(keywords)) * 25)
             
         return sum(section_scores.values())
@@ -119,18 +214,10 @@ class ResumeAnalyzer:
         
     def extract_text_from_pdf(self, file):
         try:
-            import PyPDF2
-            import io
-            
-            # Create a PDF reader object
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file.read()))
+            from utils.resume_parser import extract_pdf_pages
             
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-                
-            return text
+            # Extract text page by page without buffering the whole file twice
+            return "".join(page_text + "\n" for page_text in extract_pdf_pages(file))
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
             
@@ -172,288 +259,148 @@ class ResumeAnalyzer:
             'portfolio': ''  # Can be enhanced later
         }
 
-    def extract_education(self, text):
-        """Extract education information from resume text"""
-        education = []
-        lines = text.split('\n')
-        education_keywords = [
-            'education', 'academic', 'qualification', 'degree', 'university', 'college',
-            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
-            'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
-            'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
-        ]
-        in_education_section = False
-        current_entry = []
+    def segment_resume(self, text):
+        """Split resume text into sections in a single pass over its lines.
+
+        Every line is matched once against the combined header matcher; the
+        per-section state machines used by the extract_* methods then advance
+        side by side on that result. The segmentation of the last text seen is
+        cached, so the extractors and check_resume_sections share one pass.
+        """
+        if self._segment_cache is not None and self._segment_cache[0] == text:
+            return self._segment_cache[1]
+
+        resume_keywords = self._resume_keyword_set
+        lines = [line.strip() for line in text.split('\n')]
+        active = {section: False for section in self._section_keyword_sets}
+        current = {section: [] for section in self._section_keyword_sets}
+        entries = {section: [] for section in self._section_keyword_sets}
+        found_keywords = set()
+        line_keywords = []
+        line_sections = []
 
         for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in education_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
-                    # This line contains education info, not just a header
-                    current_entry.append(line)
-                in_education_section = True
-                continue
-            
-            if in_education_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
-                        in_education_section = False
-                        if current_entry:
-                            education.append(' '.join(current_entry))
-                            current_entry = []
+            found = self._header_matcher.find_all(line) if line else set()
+            found_keywords.update(found)
+            line_keywords.append(found)
+            line_lower = line.lower()
+            # A generic resume keyword ends any section the line does not belong to
+            is_section_break = bool(found & resume_keywords)
+            tags = []
+
+            for section, keywords in self._section_keyword_sets.items():
+                # Check for section header
+                if found and not found.isdisjoint(keywords):
+                    if line_lower not in keywords:
+                        # This line contains section info, not just a header
+                        current[section].append(line)
+                    active[section] = True
+                    tags.append(section)
+                    continue
+
+                if active[section]:
+                    # Check if we've hit another section
+                    if line and is_section_break:
+                        active[section] = False
+                        if current[section]:
+                            entries[section].append(' '.join(current[section]))
+                            current[section] = []
                         continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    education.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            education.append(' '.join(current_entry))
-        
-        return education
+
+                    if line:
+                        current[section].append(line)
+                        tags.append(section)
+                    elif current[section]:  # Empty line and we have content
+                        entries[section].append(' '.join(current[section]))
+                        current[section] = []
+
+            line_sections.append(tuple(tags))
+
+        for section, entry in current.items():
+            if entry:
+                entries[section].append(' '.join(entry))
+
+        segmentation = {
+            'lines': lines,
+            'line_keywords': line_keywords,
+            'line_sections': line_sections,
+            'sections': entries,
+            'keywords': found_keywords
+        }
+        self._segment_cache = (text, segmentation)
+        return segmentation
+
+    def extract_education(self, text):
+        """Extract education information from resume text"""
+        return list(self.segment_resume(text)['sections']['education'])
 
     def extract_experience(self, text):
         """Extract work experience information from resume text"""
-        experience = []
-        lines = text.split('\n')
-        experience_keywords = [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'career history', 'professional background',
-            'employment history', 'job history', 'positions held', 'experience',
-            'job title', 'job responsibilities', 'job description', 'job summary'
-        ]
-        in_experience_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
-                    # This line contains experience info, not just a header
-                    current_entry.append(line)
-                in_experience_section = True
-                continue
-            
-            if in_experience_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
-                        in_experience_section = False
-                        if current_entry:
-                            experience.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    experience.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            experience.append(' '.join(current_entry))
-        
-        return experience
+        return list(self.segment_resume(text)['sections']['experience'])
 
     def extract_projects(self, text):
         """Extract project information from resume text"""
-        projects = []
-        lines = text.split('\n')
-        project_keywords = [
-            'projects', 'personal projects', 'academic projects', 'key projects',
-            'major projects', 'professional projects', 'project experience',
-            'relevant projects', 'featured projects','latest projects',
-            'top projects'
-        ]
-        in_project_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in project_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
-                    # This line contains project info, not just a header
-                    current_entry.append(line)
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
-                        in_project_section = False
-                        if current_entry:
-                            projects.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    projects.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            projects.append(' '.join(current_entry))
-        
-        return projects
+        return list(self.segment_resume(text)['sections']['projects'])
 
     def extract_skills(self, text):
         """Extract skills from resume text"""
         skills = set()  # Use set to avoid duplicates
-        lines = text.split('\n')
-        skills_keywords = [
-            'skills', 'technical skills', 'competencies', 'expertise',
-            'core competencies', 'professional skills', 'key skills',
-            'technical expertise', 'proficiencies', 'qualifications',
-            'top skills', 'key skill', 'major skill', 'personal skill',
-            'soft skills', 'soft skill', 'soft skillset'
-        ]
-        in_skills_section = False
-        current_entry = []
 
         # Common skill separators
         separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
 
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in skills_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in skills_keywords):
-                    # This line contains skills, not just a header
-                    current_entry.append(line)
-                in_skills_section = True
-                continue
-            
-            if in_skills_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(skill_key.lower() in line.lower() for skill_key in skills_keywords):
-                        in_skills_section = False
-                        if current_entry:
-                            # Process the current entry
-                            text_to_process = ' '.join(current_entry)
-                            # Split by common separators
-                            for separator in separators:
-                                if separator in text_to_process:
-                                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    # Process the current entry
-                    text_to_process = ' '.join(current_entry)
-                    # Split by common separators
-                    for separator in separators:
-                        if separator in text_to_process:
-                            skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                    current_entry = []
-        
-        if current_entry:
-            # Process any remaining skills
-            text_to_process = ' '.join(current_entry)
+        for text_to_process in self.segment_resume(text)['sections']['skills']:
+            # Split by common separators
             for separator in separators:
                 if separator in text_to_process:
                     skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-        
+
         return list(skills)
 
     def extract_summary(self, text):
         """Extract summary/objective from resume text"""
+        segmentation = self.segment_resume(text)
+        lines = segmentation['lines']
+        summary_keywords = self._section_keyword_sets['summary']
         summary = []
-        lines = text.split('\n')
-        summary_keywords = [
-            'summary', 'professional summary', 'career summary', 'objective',
-            'career objective', 'professional objective', 'about me', 'profile',
-            'professional profile', 'career profile', 'overview', 'skill summary'
-        ]
-        in_summary_section = False
-        current_entry = []
 
         # Try to find summary at the beginning of the resume
         start_index = 0
-        while start_index < min(10, len(lines)) and not lines[start_index].strip():
+        while start_index < min(10, len(lines)) and not lines[start_index]:
             start_index += 1
 
         # Check first few non-empty lines for potential summary
         first_lines = []
-        lines_checked = 0
-        for line in lines[start_index:]:
-            if line.strip():
-                first_lines.append(line.strip())
-                lines_checked += 1
-                if lines_checked >= 5:  # Check first 5 non-empty lines
+        first_keywords = None
+        for line, keywords in zip(lines[start_index:], segmentation['line_keywords'][start_index:]):
+            if line:
+                if first_keywords is None:
+                    first_keywords = keywords
+                first_lines.append(line)
+                if len(first_lines) >= 5:  # Check first 5 non-empty lines
                     break
 
         # If first few lines look like a summary (no special formatting, no contact info)
-        if first_lines and not any(keyword in first_lines[0].lower() for keyword in summary_keywords):
+        if first_lines and first_keywords.isdisjoint(summary_keywords):
             potential_summary = ' '.join(first_lines)
             if len(potential_summary.split()) > 10:  # More than 10 words
                 if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
                     summary.append(potential_summary)
 
         # Look for explicitly marked summary section
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in summary_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in summary_keywords):
-                    # This line contains summary info, not just a header
-                    current_entry.append(line)
-                in_summary_section = True
-                continue
-            
-            if in_summary_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(sum_key.lower() in line.lower() for sum_key in summary_keywords):
-                        in_summary_section = False
-                        if current_entry:
-                            summary.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    summary.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            summary.append(' '.join(current_entry))
-        
+        summary.extend(segmentation['sections']['summary'])
+
         return ' '.join(summary) if summary else ''
 
-    def analyze_resume(self, resume_data, job_requirements):
-        """Analyze resume and return scores and recommendations"""
-        text = resume_data.get('raw_text', '')
-        
+    def _analyze_resume_text(self, text):
+        """Run the role-independent part of the analysis once for a resume text"""
         # Extract personal information
         personal_info = self.extract_personal_info(text)
         
         # First detect document type
         doc_type = self.detect_document_type(text)
         if doc_type != 'resume':
-            return {
-                'ats_score': 0,
-                'document_type': doc_type,
-                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
-                'section_score': 0,
-                'format_score': 0,
-                'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
-            }
-            
-        # Calculate keyword match
-        required_skills = job_requirements.get('required_skills', [])
-        keyword_match = self.calculate_keyword_match(text, required_skills)
+            return {'personal_info': personal_info, 'document_type': doc_type}
         
         # Extract all resume sections
         education = self.extract_education(text)
@@ -485,14 +432,6 @@ class ResumeAnalyzer:
         elif len(summary.split()) > 100:
             summary_suggestions.append("Consider making your summary more concise (aim for 50-75 words)")
         
-        skills_suggestions = []
-        if not skills:
-            skills_suggestions.append("Add a dedicated skills section")
-        if isinstance(skills, (list, set)) and len(list(skills)) < 5:
-            skills_suggestions.append("List more relevant technical and soft skills")
-        if keyword_match['score'] < 70:
-            skills_suggestions.append("Add more skills that match the job requirements")
-        
         experience_suggestions = []
         if not experience:
             experience_suggestions.append("Add your work experience section")
@@ -510,6 +449,7 @@ class ResumeAnalyzer:
                 experience_suggestions.append("Start bullet points with strong action verbs")
         
         education_suggestions = []
+        has_gpa = True
         if not education:
             education_suggestions.append("Add your educational background")
         else:
@@ -523,13 +463,89 @@ class ResumeAnalyzer:
                 education_suggestions.append("Include graduation dates")
             if not has_degree:
                 education_suggestions.append("Specify your degree type")
-            if not has_gpa and job_requirements.get('require_gpa', False):
-                education_suggestions.append("Include your GPA if it's above 3.0")
         
         format_suggestions = []
         if format_score < 100:
             format_suggestions.extend(format_deductions)
         
+        return {
+            'personal_info': personal_info,
+            'document_type': doc_type,
+            'education': education,
+            'experience': experience,
+            'projects': projects,
+            'skills': skills,
+            'summary': summary,
+            'section_score': section_score,
+            'format_score': format_score,
+            'has_gpa': has_gpa,
+            'contact_suggestions': contact_suggestions,
+            'summary_suggestions': summary_suggestions,
+            'experience_suggestions': experience_suggestions,
+            'education_suggestions': education_suggestions,
+            'format_suggestions': format_suggestions
+        }
+
+    def _base_ats_score(self, base, require_gpa=False):
+        """ATS score of every weighted component except the skills match"""
+        education_issues = len(base['education_suggestions'])
+        if require_gpa and not base['has_gpa']:
+            education_issues += 1
+        
+        # Calculate section-specific scores
+        contact_score = 100 - (len(base['contact_suggestions']) * 25)  # -25 for each missing item
+        summary_score = 100 - (len(base['summary_suggestions']) * 33)  # -33 for each issue
+        experience_score = 100 - (len(base['experience_suggestions']) * 25)
+        education_score = 100 - (education_issues * 25)
+        
+        return (
+            int(round(contact_score * 0.1)) +      # 10% weight for contact info
+            int(round(summary_score * 0.1)) +      # 10% weight for summary
+            int(round(experience_score * 0.2)) +   # 20% weight for experience
+            int(round(education_score * 0.1)) +    # 10% weight for education
+            int(round(base['format_score'] * 0.2)) # 20% weight for formatting
+        )
+
+    def analyze_resume(self, resume_data, job_requirements):
+        """Analyze resume and return scores and recommendations"""
+        text = resume_data.get('raw_text', '')
+        base = self._analyze_resume_text(text)
+        personal_info = base['personal_info']
+        
+        doc_type = base['document_type']
+        if doc_type != 'resume':
+            return {
+                'ats_score': 0,
+                'document_type': doc_type,
+                'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
+                'section_score': 0,
+                'format_score': 0,
+                'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
+            }
+            
+        # Calculate keyword match
+        required_skills = job_requirements.get('required_skills', [])
+        keyword_match = self.calculate_keyword_match(text, required_skills)
+        
+        skills = base['skills']
+        skills_suggestions = []
+        if not skills:
+            skills_suggestions.append("Add a dedicated skills section")
+        if isinstance(skills, (list, set)) and len(list(skills)) < 5:
+            skills_suggestions.append("List more relevant technical and soft skills")
+        if keyword_match['score'] < 70:
+            skills_suggestions.append("Add more skills that match the job requirements")
+        
+        education_suggestions = list(base['education_suggestions'])
+        if base['education'] and not base['has_gpa'] and job_requirements.get('require_gpa', False):
+            education_suggestions.append("Include your GPA if it's above 3.0")
+        
+        contact_suggestions = base['contact_suggestions']
+        summary_suggestions = base['summary_suggestions']
+        experience_suggestions = base['experience_suggestions']
+        format_suggestions = base['format_suggestions']
+        format_score = base['format_score']
+        
         # Calculate section-specific scores
         contact_score = 100 - (len(contact_suggestions) * 25)  # -25 for each missing item
         summary_score = 100 - (len(summary_suggestions) * 33)  # -33 for each issue
@@ -539,12 +555,8 @@ class ResumeAnalyzer:
         
         # Calculate overall ATS score with weighted components
         ats_score = (
-            int(round(contact_score * 0.1)) +      # 10% weight for contact info
-            int(round(summary_score * 0.1)) +      # 10% weight for summary
-            int(round(skills_score * 0.3)) +       # 30% weight for skills match
-            int(round(experience_score * 0.2)) +   # 20% weight for experience
-            int(round(education_score * 0.1)) +    # 10% weight for education
-            int(round(format_score * 0.2))         # 20% weight for formatting
+            self._base_ats_score(base, job_requirements.get('require_gpa', False)) +
+            int(round(skills_score * 0.3))         # 30% weight for skills match
         )
         
         # Combine all suggestions into a single list
@@ -564,13 +576,13 @@ class ResumeAnalyzer:
             'ats_score': ats_score,
             'document_type': 'resume',
             'keyword_match': keyword_match,
-            'section_score': section_score,
+            'section_score': base['section_score'],
             'format_score': format_score,
-            'education': education,
-            'experience': experience,
-            'projects': projects,
+            'education': base['education'],
+            'experience': base['experience'],
+            'projects': base['projects'],
             'skills': skills,
-            'summary': summary,
+            'summary': base['summary'],
             'suggestions': suggestions,
             'contact_suggestions': contact_suggestions,
             'summary_suggestions': summary_suggestions,
@@ -587,3 +599,91 @@ class ResumeAnalyzer:
                 'format': format_score
             }
         }
+
+    def analyze_resume_all_roles(self, resume_data, top_k=None):
+        """Score a resume against every role in JOB_ROLES and return them ranked by ATS score.
+
+        The resume is parsed, segmented and scanned for skills once. Keyword
+        scores for all roles then come from one product of the role-by-skill
+        matrix with the resume's skill incidence vector, which includes the
+        same semantic matches as calculate_keyword_match when the skill
+        embedding index is built. Returns an empty list when the document is
+        not a resume.
+        """
+        text = resume_data.get('raw_text', '')
+        base = self._analyze_resume_text(text)
+        if base['document_type'] != 'resume':
+            return []
+
+        roles, skills, role_skill_matrix, required_counts, require_gpa = _get_role_skill_matrix()
+        # One scan of the text with the matcher over every role's skills
+        found = get_role_skills_matcher().find_all(text)
+
+        # Same fuzzy pass as calculate_keyword_match, once for every role's missing skills
+        semantic = {}
+        skill_index = get_skill_index()
+        missing = [skill for skill in skills if skill not in found and skill]
+        if missing and skill_index is not None:
+            semantic = skill_index.match_missing(missing, self.extract_skills(text))
+        incidence = np.fromiter((skill in found or skill in semantic for skill in skills),
+                                dtype=np.float64, count=len(skills))
+
+        # Required skills found per role, counting duplicates like calculate_keyword_match
+        found_counts = role_skill_matrix @ incidence
+        keyword_scores = np.divide(found_counts, required_counts,
+                                   out=np.zeros_like(found_counts), where=required_counts > 0) * 100
+        base_scores = np.where(require_gpa, self._base_ats_score(base, True), self._base_ats_score(base, False))
+        ats_scores = base_scores + np.round(keyword_scores * 0.3).astype(int)
+
+        # Stable sort keeps JOB_ROLES order between equal scores
+        order = np.argsort(-ats_scores, kind='stable')
+        if top_k is not None:
+            order = order[:top_k]
+
+        ranked = []
+        for index in order:
+            category, role, required_skills = roles[index]
+            found_skills = [skill for skill in required_skills if skill.lower() in found or not skill]
+            semantic_matches = {skill: semantic[skill.lower()] for skill in required_skills
+                                if skill.lower() not in found and skill.lower() in semantic}
+            found_skills.extend(semantic_matches)
+            missing_skills = [skill for skill in required_skills
+                              if skill.lower() not in found and skill and skill not in semantic_matches]
+            ranked.append({
+                'category': category,
+                'role': role,
+                'ats_score': int(ats_scores[index]),
+                'keyword_match': {
+                    'score': float(keyword_scores[index]),
+                    'found_skills': found_skills,
+                    'missing_skills': missing_skills,
+                    'semantic_matches': semantic_matches
+                }
+            })
+        return ranked
+
+
+@lru_cache(maxsize=1)
+def _get_role_skill_matrix():
+    """Build the role-by-skill count matrix for JOB_ROLES once per process"""
+    from config.job_roles import JOB_ROLES
+
+    roles = []
+    skill_index = {}
+    for category, category_roles in JOB_ROLES.items():
+        for role, role_info in category_roles.items():
+            required_skills = role_info.get('required_skills', [])
+            roles.append((category, role, required_skills))
+            for skill in required_skills:
+                skill_index.setdefault(skill.lower(), len(skill_index))
+
+    role_skill_matrix = np.zeros((len(roles), len(skill_index)))
+    for row, (_, _, required_skills) in enumerate(roles):
+        for skill in required_skills:
+            role_skill_matrix[row, skill_index[skill.lower()]] += 1
+
+    required_counts = np.array([len(required_skills) for _, _, required_skills in roles], dtype=np.float64)
+    require_gpa = np.array([
+        bool(JOB_ROLES[category][role].get('require_gpa', False)) for category, role, _ in roles
+    ])
+    return roles, list(skill_index), role_skill_matrix, required_counts, require_gpa
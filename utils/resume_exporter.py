@@ -0,0 +1,110 @@
+"""Streaming export of the admin resume table.
+
+Usage:
+    python -m utils.resume_exporter resumes.csv
+    python -m utils.resume_exporter resumes.xlsx --page-size 2000
+    python -m utils.resume_exporter resumes.parquet
+
+Rows are read with keyset pagination and written one page at a time, so
+memory stays bounded by the page size rather than the table size.
+"""
+import argparse
+import csv
+import os
+import sys
+
+from config.database import RESUME_EXPORT_COLUMNS, iter_resume_data_pages
+
+EXPORT_FORMATS = ('csv', 'xlsx', 'parquet')
+
+
+def export_csv(path, pages, columns=RESUME_EXPORT_COLUMNS):
+    """Write pages of rows to a CSV file and return the row count"""
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for rows in pages:
+            writer.writerows(rows)
+            count += len(rows)
+    return count
+
+
+def export_xlsx(path, pages, columns=RESUME_EXPORT_COLUMNS):
+    """Write pages of rows to an XLSX file and return the row count"""
+    from openpyxl import Workbook
+
+    # Write-only workbooks flush rows to disk instead of keeping cell objects
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Resumes')
+    sheet.append(columns)
+    count = 0
+    for rows in pages:
+        for row in rows:
+            sheet.append(row)
+        count += len(rows)
+    workbook.save(path)
+    return count
+
+
+def export_parquet(path, pages, columns=RESUME_EXPORT_COLUMNS):
+    """Write pages of rows to a Parquet file, one row group per page, and return the row count"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+
+    schema = pa.schema([
+        ('id', pa.int64()), ('name', pa.string()), ('email', pa.string()), ('phone', pa.string()),
+        ('linkedin', pa.string()), ('github', pa.string()), ('portfolio', pa.string()),
+        ('target_role', pa.string()), ('target_category', pa.string()), ('created_at', pa.string()),
+        ('ats_score', pa.float64()), ('keyword_match_score', pa.float64()),
+        ('format_score', pa.float64()), ('section_score', pa.float64())
+    ])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows in pages:
+            batch = pa.RecordBatch.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)],
+                schema=schema
+            )
+            writer.write_batch(batch)
+            count += len(rows)
+    return count
+
+
+EXPORTERS = {
+    'csv': export_csv,
+    'xlsx': export_xlsx,
+    'parquet': export_parquet
+}
+
+
+def export_resumes(path, fmt=None, page_size=1000):
+    """Export all resume data to ``path`` as CSV, XLSX or Parquet and return the row count.
+
+    The format defaults to the file extension.
+    """
+    fmt = (fmt or os.path.splitext(path)[1].lstrip('.')).lower()
+    if fmt not in EXPORTERS:
+        raise ValueError(f"Unsupported export format '{fmt}', expected one of {', '.join(EXPORT_FORMATS)}")
+    return EXPORTERS[fmt](path, iter_resume_data_pages(page_size))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export resume data to CSV, XLSX or Parquet")
+    parser.add_argument('output', help="Output file; the format is taken from its extension")
+    parser.add_argument('--format', '-f', choices=EXPORT_FORMATS, help="Override the output format")
+    parser.add_argument('--page-size', type=int, default=1000, help="Resumes read per page")
+    args = parser.parse_args(argv)
+
+    try:
+        count = export_resumes(args.output, fmt=args.format, page_size=args.page_size)
+    except (ValueError, ImportError) as e:
+        parser.error(str(e))
+    print(f"Exported {count} rows to {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,189 @@
 import PyPDF2
 import docx
 import re
+import string
+import threading
+import time
 from io import BytesIO
 
+# Upper bounds for a single uploaded PDF
+MAX_PDF_BYTES = 10 * 1024 * 1024
+MAX_PDF_PAGES = 50
+
+# Fast-path text scoring below this is treated as garbled
+MIN_TEXT_QUALITY = 0.75
+
+class PDFBackend:
+    """Interface for PDF text extraction backends"""
+    name = None
+
+    def iter_pages(self, stream, max_pages):
+        """Yield the text of each page, stopping after max_pages"""
+        raise NotImplementedError
+
+class PyPDF2Backend(PDFBackend):
+    """Fast extraction straight from the PDF content streams"""
+    name = 'pypdf2'
+
+    def iter_pages(self, stream, max_pages):
+        pdf_reader = PyPDF2.PdfReader(stream)
+        for page_number, page in enumerate(pdf_reader.pages):
+            if max_pages and page_number >= max_pages:
+                break
+            yield page.extract_text() or ""
+
+class PDFMinerBackend(PDFBackend):
+    """Slower, layout-aware extraction that rebuilds lines and word spacing"""
+    name = 'pdfminer'
+
+    def iter_pages(self, stream, max_pages):
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LAParams, LTTextContainer
+
+        for page_layout in extract_pages(stream, laparams=LAParams(), maxpages=max_pages or 0):
+            yield "".join(element.get_text() for element in page_layout
+                          if isinstance(element, LTTextContainer))
+
+PDF_BACKENDS = {backend.name: backend for backend in (PyPDF2Backend(), PDFMinerBackend())}
+FAST_BACKEND = 'pypdf2'
+LAYOUT_BACKEND = 'pdfminer'
+
+_backend_stats = {name: {'calls': 0, 'pages': 0, 'seconds': 0.0, 'errors': 0} for name in PDF_BACKENDS}
+_backend_stats_lock = threading.Lock()
+_fallbacks = 0
+
+def _record_backend_run(name, pages, seconds, failed=False):
+    with _backend_stats_lock:
+        stats = _backend_stats[name]
+        stats['calls'] += 1
+        stats['pages'] += pages
+        stats['seconds'] += seconds
+        if failed:
+            stats['errors'] += 1
+
+def get_pdf_backend_stats():
+    """Return per-backend call, page, time and error counters plus the fallback count"""
+    with _backend_stats_lock:
+        stats = {name: dict(counters) for name, counters in _backend_stats.items()}
+        stats['fallbacks'] = _fallbacks
+    return stats
+
+def _open_pdf_stream(pdf_file, max_bytes):
+    """Return a seekable stream for the PDF, rejecting files over max_bytes"""
+    stream = pdf_file
+    if not (hasattr(stream, 'seekable') and stream.seekable()):
+        # Read one byte past the limit at most, so an oversized stream never fills memory
+        data = pdf_file.read(max_bytes + 1) if max_bytes else pdf_file.read()
+        if max_bytes and len(data) > max_bytes:
+            raise ValueError(f"PDF is larger than the {max_bytes} byte limit")
+        stream = BytesIO(data)
+
+    start = stream.tell()
+    size = stream.seek(0, 2) - start
+    stream.seek(start)
+    if max_bytes and size > max_bytes:
+        raise ValueError(f"PDF is {size} bytes, larger than the {max_bytes} byte limit")
+    return stream
+
+def _iter_backend_pages(backend, stream, max_pages):
+    """Yield pages from a backend, timing only the time spent extracting"""
+    pages = 0
+    seconds = 0.0
+    failed = False
+    iterator = backend.iter_pages(stream, max_pages)
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                text = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                seconds += time.perf_counter() - started
+            pages += 1
+            yield text
+    except Exception:
+        failed = True
+        raise
+    finally:
+        _record_backend_run(backend.name, pages, seconds, failed)
+
+def iter_pdf_pages(pdf_file, max_pages=MAX_PDF_PAGES, max_bytes=MAX_PDF_BYTES, backend=FAST_BACKEND):
+    """Yield the text of each PDF page lazily.
+
+    Seekable file objects (such as Streamlit uploads) are handed to the
+    backend directly instead of being copied into another buffer. Files larger
+    than ``max_bytes`` are rejected with a ValueError before parsing, and pages
+    past ``max_pages`` are never extracted.
+    """
+    stream = _open_pdf_stream(pdf_file, max_bytes)
+    yield from _iter_backend_pages(PDF_BACKENDS[backend], stream, max_pages)
+
+def text_quality(text):
+    """Score extracted text between 0 and 1; low scores indicate garbled output.
+
+    Penalizes unprintable or replacement characters, unresolved ``(cid:N)``
+    glyphs, letters split apart by spaces and words glued together.
+    """
+    stripped = text.strip()
+    if len(stripped) < 20:
+        return 0.0
+
+    allowed = set(string.printable) | set('•–—―·→’‘“”')
+    readable = sum(1 for char in stripped if char.isalnum() or char in allowed)
+    score = readable / len(stripped)
+    score *= 1 - min(1.0, stripped.count('(cid:') * 6 / len(stripped))
+
+    words = stripped.split()
+    single_chars = sum(1 for word in words if len(word) == 1 and word.isalpha()) / len(words)
+    glued = sum(1 for word in words if len(word) > 25) / len(words)
+    score *= 1 - max(0.0, single_chars - 0.25)
+    score *= 1 - min(1.0, glued * 4)
+    return max(0.0, score)
+
+def extract_pdf_pages(pdf_file, max_pages=MAX_PDF_PAGES, max_bytes=MAX_PDF_BYTES, min_quality=MIN_TEXT_QUALITY):
+    """Extract PDF page texts with the fast backend, falling back to the layout-aware one.
+
+    The layout backend is only run when the fast result scores below
+    ``min_quality`` or the fast backend fails; whichever result scores higher
+    is returned.
+    """
+    global _fallbacks
+    stream = _open_pdf_stream(pdf_file, max_bytes)
+    start = stream.tell()
+
+    fast_error = None
+    try:
+        pages = list(_iter_backend_pages(PDF_BACKENDS[FAST_BACKEND], stream, max_pages))
+        quality = text_quality("\n".join(pages))
+    except Exception as e:
+        fast_error = e
+        pages, quality = [], 0.0
+
+    if quality >= min_quality:
+        return pages
+
+    with _backend_stats_lock:
+        _fallbacks += 1
+    stream.seek(start)
+    try:
+        layout_pages = list(_iter_backend_pages(PDF_BACKENDS[LAYOUT_BACKEND], stream, max_pages))
+    except Exception:
+        if fast_error is not None:
+            raise fast_error
+        return pages
+
+    if fast_error is not None or text_quality("\n".join(layout_pages)) > quality:
+        return layout_pages
+    return pages
+
 class ResumeParser:
     def __init__(self):
         pass
         
     def extract_text_from_pdf(self, pdf_file):
         try:
-            pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_file.read()))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            return "\n".join(extract_pdf_pages(pdf_file)).strip()
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
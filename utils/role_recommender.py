@@ -0,0 +1,97 @@
+"""Recommend target roles from a resume's skills.
+
+Every JOB_ROLES entry becomes a sparse TF-IDF vector over its required and
+recommended skills. A resume is encoded against the same vocabulary and
+compared with all roles at once through one sparse matrix product.
+"""
+from functools import lru_cache
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from config.job_roles import JOB_ROLES
+from config.role_index import split_skill
+from utils.keyword_matcher import KeywordMatcher
+
+
+def _role_skill_keys(info):
+    """Normalized skill keys for a role; "React/Angular/Vue" counts each option"""
+    recommended = info.get('recommended_skills', {})
+    skills = info.get('required_skills', []) + recommended.get('technical', []) + recommended.get('soft', [])
+    keys = []
+    for skill in skills:
+        keys.extend(split_skill(skill))
+    return keys
+
+
+def _identity(keys):
+    return keys
+
+
+class RoleRecommender:
+    """Top-k role recommendations by cosine similarity of TF-IDF skill vectors"""
+
+    def __init__(self, job_roles=JOB_ROLES):
+        self.roles = []
+        documents = []
+        for category, roles in job_roles.items():
+            for role, info in roles.items():
+                self.roles.append((category, role))
+                documents.append(_role_skill_keys(info))
+
+        # Documents are already skill keys, so the analyzer passes them through
+        self.vectorizer = TfidfVectorizer(analyzer=_identity, lowercase=False)
+        # Rows are L2-normalized, so a dot product with a normalized query is the cosine
+        self.role_matrix = self.vectorizer.fit_transform(documents).tocsr()
+        self.vocabulary = self.vectorizer.vocabulary_
+        self.idf = self.vectorizer.idf_.astype(np.float64)
+        # Whole words only: short skills like "r", "ui" or "ci" occur inside ordinary words
+        self._text_matcher = KeywordMatcher(self.vocabulary, word_boundaries=True)
+
+    def encode(self, skills):
+        """Encode a list of skills as a normalized 1 x vocabulary sparse row"""
+        indices = sorted({self.vocabulary[key]
+                          for skill in skills
+                          for key in split_skill(skill)
+                          if key in self.vocabulary})
+        # Built straight from vocabulary_ and idf_; vectorizer.transform is far slower per call
+        weights = self.idf[indices]
+        norm = np.sqrt(np.dot(weights, weights))
+        if norm:
+            weights = weights / norm
+        return csr_matrix((weights, indices, [0, len(indices)]), shape=(1, len(self.vocabulary)))
+
+    def recommend(self, skills, top_k=5):
+        """Return the top_k roles for a list of skills, best first"""
+        query = self.encode(skills)
+        if not query.nnz:
+            return []
+
+        scores = (self.role_matrix @ query.T).toarray().ravel()
+        top_k = min(top_k or len(scores), len(scores))
+        if top_k < len(scores):
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind='stable')]
+
+        return [
+            {
+                'category': self.roles[i][0],
+                'role': self.roles[i][1],
+                'score': round(float(scores[i]) * 100, 1)
+            }
+            for i in top
+            if scores[i] > 0
+        ]
+
+    def recommend_for_text(self, text, top_k=5):
+        """Return the top_k roles for the skills mentioned anywhere in a resume text"""
+        return self.recommend(self._text_matcher.find_all(text), top_k)
+
+
+@lru_cache(maxsize=1)
+def get_role_recommender():
+    """Return the process-wide recommender over JOB_ROLES"""
+    return RoleRecommender()
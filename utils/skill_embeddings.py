@@ -0,0 +1,234 @@
+"""Fuzzy skill matching against a precomputed character n-gram embedding table.
+
+Usage:
+    python -m utils.skill_embeddings build
+    python -m utils.skill_embeddings build --skills extra_skills.txt --output /srv/skill_embeddings
+
+The build step embeds every JOB_ROLES skill plus SKILL_ALIASES with hashed
+character n-grams and writes the table as ``<output>.npy`` (a float32 array
+read back as a memmap) and ``<output>.json`` (terms and settings). At run
+time an extracted skill such as "ReactJS" or "Postgres" is mapped to its
+nearest known skill, and only matches above the similarity threshold count.
+The default location is ``skill_embeddings`` in the repository root, or
+$SKILL_EMBEDDINGS_PATH when set.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from config.job_roles import JOB_ROLES
+from config.role_index import split_skill
+
+# Next to the package rather than the working directory, so every entry point finds it
+DEFAULT_INDEX_PATH = os.environ.get(
+    'SKILL_EMBEDDINGS_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'skill_embeddings'))
+DEFAULT_THRESHOLD = 0.75
+N_FEATURES = 2 ** 13
+NGRAM_RANGE = (2, 4)
+
+# Spellings that character n-grams cannot relate to the skill they stand for
+SKILL_ALIASES = {
+    'javascript': ['js', 'ecmascript', 'es6'],
+    'react': ['reactjs', 'react.js', 'react js'],
+    'angular': ['angularjs', 'angular.js'],
+    'vue.js': ['vue', 'vuejs'],
+    'node.js': ['node', 'nodejs', 'node js'],
+    'sql': ['postgres', 'postgresql', 'mysql', 'sqlite', 'mssql', 'sql server', 't-sql', 'pl/sql', 'oracle db'],
+    'kubernetes': ['k8s'],
+    'machine learning': ['ml'],
+    'deep learning': ['dl', 'neural networks'],
+    'aws': ['amazon web services'],
+    'gcp': ['google cloud', 'google cloud platform'],
+    'azure': ['microsoft azure'],
+    'ci/cd': ['continuous integration', 'continuous delivery', 'jenkins', 'github actions'],
+    'infrastructure as code': ['iac', 'terraform'],
+    'c++': ['cpp'],
+    'c#': ['csharp', 'c sharp'],
+    'python': ['python3'],
+    'tensorflow': ['tf', 'keras'],
+    'pytorch': ['torch'],
+    'excel': ['ms excel', 'microsoft excel'],
+    'data visualization': ['tableau', 'power bi', 'matplotlib']
+}
+
+
+def normalize_skill(skill):
+    """Lowercase a skill and drop list labels ("Languages: Python") and stray punctuation"""
+    skill = str(skill).lower()
+    if ':' in skill:
+        skill = skill.rsplit(':', 1)[1]
+    return re.sub(r'\s+', ' ', skill).strip(' .;()[]')
+
+
+def _make_vectorizer(n_features=N_FEATURES):
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    # Hashing needs no fitted vocabulary, so queries are encoded without the build step's state
+    return HashingVectorizer(analyzer='char_wb', ngram_range=NGRAM_RANGE, n_features=n_features,
+                             alternate_sign=False, norm='l2')
+
+
+def default_vocabulary():
+    """Return (term, skill) pairs for every JOB_ROLES skill and alias"""
+    pairs = {}
+    # Aliases go first so a JOB_ROLES fragment like "vue" (from "React/Angular/Vue")
+    # still maps to the skill roles require, "vue.js"
+    for skill, aliases in SKILL_ALIASES.items():
+        pairs.setdefault(skill, skill)
+        for alias in aliases:
+            pairs.setdefault(normalize_skill(alias), skill)
+    for roles in JOB_ROLES.values():
+        for info in roles.values():
+            for skill in info.get('required_skills', []) + info.get('recommended_skills', {}).get('technical', []):
+                for key in split_skill(skill):
+                    pairs.setdefault(normalize_skill(key), normalize_skill(key))
+    return sorted(pairs.items())
+
+
+def build_index(path=DEFAULT_INDEX_PATH, extra_skills=(), n_features=N_FEATURES):
+    """Embed the skill vocabulary and write the table; returns the number of terms"""
+    pairs = dict(default_vocabulary())
+    for skill in extra_skills:
+        key = normalize_skill(skill)
+        if key:
+            pairs.setdefault(key, key)
+    terms = sorted(pairs)
+
+    # Stored feature-major: a query's few n-gram features read a few contiguous rows
+    embeddings = _make_vectorizer(n_features).transform(terms).T.toarray().astype(np.float32)
+    # Written aside and swapped in, so a process memory-mapping the old table keeps valid data
+    with open(f"{path}.npy.tmp", 'wb') as f:
+        np.save(f, embeddings)
+    with open(f"{path}.json.tmp", 'w', encoding='utf-8') as f:
+        json.dump({
+            'terms': terms,
+            'skills': [pairs[term] for term in terms],
+            'n_features': n_features
+        }, f)
+    os.replace(f"{path}.npy.tmp", f"{path}.npy")
+    os.replace(f"{path}.json.tmp", f"{path}.json")
+    return len(terms)
+
+
+class SkillEmbeddingIndex:
+    """Nearest-neighbour lookups of skills in a built embedding table"""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH, threshold=DEFAULT_THRESHOLD, cache_size=4096):
+        with open(f"{path}.json", 'rb') as f:
+            raw_meta = f.read()
+        meta = json.loads(raw_meta)
+        # Identifies the table's contents; the vectors are derived from the terms and settings
+        self.fingerprint = hashlib.sha256(raw_meta).hexdigest()[:12]
+        self.terms = meta['terms']
+        self.skills = meta['skills']
+        self.threshold = threshold
+        self.embeddings = np.load(f"{path}.npy", mmap_mode='r')
+        self.vectorizer = _make_vectorizer(meta['n_features'])
+        self._exact = dict(zip(self.terms, self.skills))
+        self.nearest = lru_cache(maxsize=cache_size)(self._nearest)
+
+    def _nearest(self, key):
+        """Return (skill, similarity) for a normalized key, or None below the threshold"""
+        if key in self._exact:
+            return self._exact[key], 1.0
+        query = self.vectorizer.transform([key])
+        if not query.nnz:
+            return None
+        # Cosine against every term: both sides are L2-normalized
+        scores = query.data.astype(np.float32) @ self.embeddings[query.indices]
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return self.skills[best], float(scores[best])
+
+    def match(self, skill):
+        """Return the known skill closest to ``skill``, or None"""
+        result = self.nearest(normalize_skill(skill))
+        return result[0] if result else None
+
+    def match_missing(self, missing_skills, resume_skills):
+        """Map each missing required skill to the resume skill that semantically covers it"""
+        wanted = {}
+        for skill in missing_skills:
+            wanted.setdefault(normalize_skill(skill), []).append(skill)
+
+        matches = {}
+        for resume_skill in resume_skills:
+            canonical = self.match(resume_skill)
+            for skill in wanted.pop(canonical, ()):
+                matches[skill] = resume_skill
+            if not wanted:
+                break
+        # Keep the order of missing_skills, as found_skills does for exact matches
+        return {skill: matches[skill] for skill in missing_skills if skill in matches}
+
+
+# Seconds between checks of the index files on disk
+RECHECK_SECONDS = 30.0
+
+_indexes = {}
+_next_checks = {}
+_index_lock = threading.Lock()
+
+
+def _index_mtime(path):
+    """Return the newer mtime of the two index files, or None when either is missing"""
+    try:
+        return max(os.path.getmtime(f"{path}.npy"), os.path.getmtime(f"{path}.json"))
+    except OSError:
+        return None
+
+
+def get_skill_index(path=DEFAULT_INDEX_PATH):
+    """Return the shared index, or None when it has not been built.
+
+    The files are checked at most every RECHECK_SECONDS, so an index built or
+    rebuilt while the process runs is picked up shortly after; calls in between
+    return the loaded index without touching the disk or the lock.
+    """
+    entry = _indexes.get(path)
+    if time.monotonic() < _next_checks.get(path, 0):
+        return entry[0] if entry else None
+
+    with _index_lock:
+        now = time.monotonic()
+        if now >= _next_checks.get(path, 0):
+            _next_checks[path] = now + RECHECK_SECONDS
+            mtime = _index_mtime(path)
+            entry = _indexes.get(path)
+            if mtime is not None and (entry is None or entry[1] != mtime):
+                try:
+                    _indexes[path] = (SkillEmbeddingIndex(path), mtime)
+                except Exception as e:
+                    print(f"Error loading skill embeddings: {str(e)}")
+        entry = _indexes.get(path)
+        return entry[0] if entry else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Skill embedding index for fuzzy skill matching")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--output', '-o', default=DEFAULT_INDEX_PATH,
+                        help="Path prefix for the .npy and .json files")
+    parser.add_argument('--skills', help="Extra skills, one per line")
+    args = parser.parse_args(argv)
+
+    extra_skills = []
+    if args.skills:
+        with open(args.skills, encoding='utf-8') as f:
+            extra_skills = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+    count = build_index(args.output, extra_skills)
+    print(f"Wrote {count} skill embeddings to {args.output}.npy")
+
+
+if __name__ == '__main__':
+    main()